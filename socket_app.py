@@ -1,45 +1,119 @@
 from __future__ import annotations
 
+import atexit
+import hashlib
 import os
 import importlib.resources as importlib_resources
 import logging
 from typing import Any, Dict, Tuple, Optional, Callable
 import re
+import threading
 import time
+from concurrent.futures import Future, ThreadPoolExecutor
 
 from dotenv import load_dotenv
 from slack_bolt import App as SlackApp
 from slack_bolt.adapter.socket_mode import SocketModeHandler
+from slack_sdk.http_retry.builtin_handlers import RateLimitErrorRetryHandler
 
 from incident_agent.extract import IncidentExtractor
-from incident_agent.render import render_markdown
 from incident_agent import messages as MSG
 from incident_agent.jira_client import JiraClient
-from incident_agent.schema import IncidentTemplate, DUTCH_FIELD_LABELS
+from incident_agent.schema import DUTCH_FIELD_LABELS
+from incident_agent.store import SessionStore
 import incident_agent.utils as utils
 
+log = logging.getLogger(__name__)
 
-# In-memory state: keyed by (channel, thread_ts)
-ConversationKey = Tuple[str, str]
-state: Dict[ConversationKey, Dict[str, Any]] = {}
-
-# Lightweight per-user session store for DM sessions
+# Per-thread conversation state (keyed by (channel, thread_ts)) and per-user
+# DM sessions, both held in STORE
 # session schema: {
 #   'user_id': str,
 #   'state': 'IDLE' | 'WAITING_FOR_INCIDENT' | 'ACTIVE',
 #   'linked_issue_key': Optional[str],
-#   'pending_incident_keys': list[str],
+#   'pending_incident_keys': dict[str, None],  # insertion-ordered set of ISO keys
 #   'dm_channel': Optional[str],
 # }
-UserId = str
-SESSIONS: Dict[UserId, Dict[str, Any]] = {}
 
 # Regex to detect Jira ISO issue keys from URLs
 ISO_REGEX = re.compile(r"/browse/(ISO-\d+)")
+ISO_URL_MARKER = "/browse/ISO-"
+# Reporter detection in the shared message: a user mention, or "<Name> heeft onder issue ..."
+USER_MENTION_RE = re.compile(r"<@([UW][A-Z0-9]+)>")
+NAME_REPORTER_RE = re.compile(r"([^\n]+?)\s+heeft\s+onder\s+issue\s+", re.IGNORECASE)
+
+# Slack user name (lowercased) → user id, refreshed from users.list after the TTL
+USERS_CACHE_TTL_SECONDS: int = 5 * 60
+USERS_CACHE: Dict[str, Any] = {"expires": 0.0, "by_name": {}}
+# Held while refreshing, so concurrent events trigger a single users.list walk
+USERS_CACHE_LOCK = threading.Lock()
+USERS_LIST_PAGE_SIZE: int = 1000
+
+# Recent top-level DM messages per channel; the link-confirmation path reads them
+# several times in quick succession. Dropped when the user posts in the DM.
+DM_HISTORY_TTL_SECONDS: float = 20.0
+DM_HISTORY_LIMIT: int = 100
+DM_HISTORY_CACHE: Dict[str, tuple[float, list]] = {}
+DM_HISTORY_CACHE_LOCK = threading.Lock()
 
 # Max age for a user session before it is considered stale (2 days)
 SESSION_MAX_AGE_SECONDS: int = 2 * 24 * 60 * 60
 
+# Conversations and sessions (see the schema above); expired entries are swept
+STORE = SessionStore(session_ttl_seconds=SESSION_MAX_AGE_SECONDS)
+
+# Pause between the parts of the intake form, so they read as separate messages
+FORM_PART_DELAY_SECONDS: float = 2.0
+# Pause after the pending-incident picker before the conversation continues
+PENDING_PICKER_DELAY_SECONDS: float = 3.0
+
+# Jira client shared by all threads, created on first use so its HTTP session
+# (keep-alive connections) and detected REST API version are reused
+JIRA: Dict[str, Optional[JiraClient]] = {"client": None}
+JIRA_LOCK = threading.Lock()
+
+# Retries per Web API call answered with HTTP 429; each waits for Retry-After plus jitter
+SLACK_RATE_LIMIT_RETRIES: int = 8
+
+# Model calls used to run on Bolt's event workers; keep the same capacity by default
+DEFAULT_SOCKET_CONCURRENCY: int = 10
+
+# Background workers for slow model calls that should not block the Slack event
+# dispatcher; main() resizes it to SLACK_SOCKET_CONCURRENCY once .env is loaded.
+# Threads are only started on submit, so the default pool costs nothing.
+EXECUTOR = ThreadPoolExecutor(max_workers=DEFAULT_SOCKET_CONCURRENCY)
+# Jira attachment uploads get their own pool so they never queue ahead of replies
+ATTACH_EXECUTOR = ThreadPoolExecutor(max_workers=2)
+
+# Slack redelivers events it did not see acknowledged in time; client_msg_id → first seen
+SEEN_MESSAGE_TTL_SECONDS: float = 60.0
+SEEN_MESSAGES: Dict[str, float] = {}
+SEEN_MESSAGES_LOCK = threading.Lock()
+
+# Thread command keywords (matched against the lowercased message text)
+CMD_FINALIZE = frozenset(
+    {"finaliseer", "finaliseren", "finalize", "finaliseren aub", "finalise"}
+)
+CMD_JIRA = frozenset({"jira", "/jira"})
+CMD_STATUS = frozenset({"status", "/status"})
+CMD_FIELDS = frozenset({"fields", "/fields", "velden", "/velden"})
+CMD_SHOW = frozenset({"show", "/show", "toon", "/toon", "preview", "/preview"})
+CMD_CONTINUE = frozenset({"continue", "/continue", "verder", "/verder"})
+CMD_SHOWMODE = frozenset({"showmode", "/showmode"})
+CMD_CANCEL = frozenset({"cancel", "/cancel"})
+CMD_HELP = frozenset({"help", "/help"})
+# Starts the questionnaire from the preface/form steps
+CMD_START = frozenset({"start", "/start"})
+
+# Commands that ask for confirmation first while answers are incomplete
+CONFIRM_ACTIONS = frozenset({"finalize", "jira"})
+
+# Leading tokens of thread commands that take arguments
+MODE_PREFIXES: Tuple[str, ...] = ("mode ", "/mode ")
+EDIT_PREFIXES: Tuple[str, ...] = ("edit ", "/edit ", "wijzig ")
+# edit <field> <value>, parsed in one match; the value may span lines
+EDIT_RE = re.compile(r"^/?(?:edit|wijzig)\s+(\S+)\s+(.+)$", re.IGNORECASE | re.DOTALL)
+
 
 def build_slack_app() -> SlackApp:
     """
@@ -48,13 +122,17 @@ def build_slack_app() -> SlackApp:
     @return SlackApp: Configured Slack Bolt application ready for Socket Mode handler.
     """
     app = SlackApp(token=os.environ.get("SLACK_BOT_TOKEN"))
+    # Bolt copies these handlers into the client passed to every listener
+    app.client.retry_handlers.append(
+        RateLimitErrorRetryHandler(max_retry_count=SLACK_RATE_LIMIT_RETRIES)
+    )
     extractor = IncidentExtractor()
     # Helper functions are imported from incident_agent.utils
 
     # ===== Session helpers =====
     def _get_or_create_session(user_id: str) -> Dict[str, Any]:
-        print(f"SESSIONS: {SESSIONS}")
-        sess = SESSIONS.get(user_id)
+        log.debug("STORE: %s", STORE)
+        sess = STORE.get(user_id)
         if sess:
             try:
                 created_at_raw = sess.get("created_at")
@@ -80,16 +158,16 @@ def build_slack_app() -> SlackApp:
             "user_id": user_id,
             "state": "WAITING_FOR_INCIDENT",
             "linked_issue_key": None,
-            "pending_incident_keys": [],
+            "pending_incident_keys": {},
             "dm_channel": None,
             "created_at": now,
             "updated_at": now,
         }
-        SESSIONS[user_id] = sess
+        STORE.put(user_id, sess)
         return sess
 
     def _set_session_dm(user_id: str, channel_id: Optional[str]) -> None:
-        sess = SESSIONS.get(user_id)
+        sess = STORE.get(user_id)
         if not sess:
             return
         sess["dm_channel"] = channel_id
@@ -100,7 +178,7 @@ def build_slack_app() -> SlackApp:
 
     def _ensure_dm_channel(client, user_id: str) -> Optional[str]:
         sess = _get_or_create_session(user_id)
-        print(f"ensure_dm_channel session: {sess}")
+        log.debug("ensure_dm_channel session: %s", sess)
         if sess.get("dm_channel"):
             return str(sess["dm_channel"])  # type: ignore
         try:
@@ -118,7 +196,7 @@ def build_slack_app() -> SlackApp:
         Resolve a user's session from their DM channel id, if available.
         """
         try:
-            for sess in SESSIONS.values():
+            for sess in STORE.sessions():
                 if sess.get("dm_channel") == channel_id:
                     return sess
         except Exception:
@@ -136,21 +214,17 @@ def build_slack_app() -> SlackApp:
     ) -> None:
         # If we are in the form state, wait for explicit 'start' to continue to questionnaire
         if conv.get("status") == "form":
-            if text in {"start", "/start"}:
+            if text in CMD_START:
                 _start_regular_flow(channel, root_ts, say)
                 return
             # Otherwise, ignore other input and remind user to type start
-            sess = _get_session_for_channel(channel)
-            say(
-                text=MSG.preface_step_text(len(MSG.PREFACE_STEPS), sess),
-                thread_ts=root_ts,
-            )
+            _remind_start(_get_session_for_channel(channel), root_ts, say)
             return
         idx = int(conv.get("preface_index", 1))
         total = len(MSG.PREFACE_STEPS)
         # Steps 1-6 require confirmation (yes/ok)
         if idx < total:
-            if utils.is_accept(text_raw) or utils.is_yes(text_raw):
+            if text in utils.ACCEPT_WORDS:
                 conv["preface_index"] = idx + 1
                 sess = _get_session_for_channel(channel)
                 if (idx + 1) == 2:
@@ -194,14 +268,25 @@ def build_slack_app() -> SlackApp:
                 say(text=MSG.preface_step_incomplete(idx), thread_ts=root_ts)
             return
         # Step 7 requires 'start' to proceed
-        if text in {"start", "/start"}:
+        if text in CMD_START:
             _start_regular_flow(channel, root_ts, say)
             return
         else:
-            sess = _get_session_for_channel(channel)
-            say(text=MSG.preface_step_text(idx, sess), thread_ts=root_ts)
+            _remind_start(_get_session_for_channel(channel), root_ts, say)
             return
 
+    def _remind_start(sess: Optional[Dict[str, Any]], root_ts: str, say_like) -> None:
+        """
+        Repeat the final preface step, which tells the user to type `start`.
+
+        @param sess: User session (for the linked issue key), if any
+        @param root_ts: Thread root timestamp
+        @param say_like: Callable compatible with say(text=..., thread_ts=...)
+        """
+        say_like(
+            text=MSG.preface_step_text(len(MSG.PREFACE_STEPS), sess), thread_ts=root_ts
+        )
+
     def _reconstruct_last_message_from_state(
         channel: str, root_ts: str, say: Callable[[str, str], None]
     ) -> None:
@@ -215,7 +300,7 @@ def build_slack_app() -> SlackApp:
         - Current question prompt
         - Done guidance
         """
-        conv = state.get((channel, root_ts)) or {}
+        conv = STORE.get_conv(channel, root_ts) or {}
         if not conv:
             _start_preface_flow(channel, root_ts, say)
 
@@ -227,10 +312,17 @@ def build_slack_app() -> SlackApp:
                 preface_idx = 1
             total_steps = len(MSG.PREFACE_STEPS)
             sess = _get_session_for_channel(channel)
+            current_step = MSG.preface_step_text(preface_idx, sess)
             if status == "form":
                 # During the form gate, remind the final preface step which instructs to type start
-                say(text=MSG.preface_step_text(total_steps, sess), thread_ts=root_ts)
-            say(text=MSG.preface_step_text(preface_idx, sess), thread_ts=root_ts)
+                _say_pair(
+                    say,
+                    MSG.preface_step_text(total_steps, sess),
+                    current_step,
+                    root_ts,
+                )
+            else:
+                say(text=current_step, thread_ts=root_ts)
 
         pending = conv.get("pending") or {}
         if isinstance(pending, dict) and pending.get("field"):
@@ -249,6 +341,29 @@ def build_slack_app() -> SlackApp:
 
         return MSG.no_open_questions_with_jira()
 
+    def _recent_dm_messages(client, dm_channel: str) -> list:
+        """
+        Return the latest top-level messages of a DM, newest first, via a short-lived cache.
+
+        @param client: Slack WebClient
+        @param dm_channel: DM channel id
+        @return list: Up to DM_HISTORY_LIMIT message dicts
+        """
+        now = time.time()
+        with DM_HISTORY_CACHE_LOCK:
+            cached = DM_HISTORY_CACHE.get(dm_channel)
+            if cached and now - cached[0] < DM_HISTORY_TTL_SECONDS:
+                return cached[1]
+        hist = client.conversations_history(  # type: ignore[attr-defined]
+            channel=dm_channel,
+            limit=DM_HISTORY_LIMIT,
+            inclusive=True,
+        )
+        msgs = hist.get("messages", []) or []
+        with DM_HISTORY_CACHE_LOCK:
+            DM_HISTORY_CACHE[dm_channel] = (now, msgs)
+        return msgs
+
     def _reply_in_active_thread_and_continue(
         client, dm_channel: str, issue_key: str
     ) -> None:
@@ -263,12 +378,7 @@ def build_slack_app() -> SlackApp:
         root_ts = ""
         try:
             # Fetch recent top-level messages and pick the thread with the most recent activity
-            hist = client.conversations_history(  # type: ignore[attr-defined]
-                channel=dm_channel,
-                limit=50,
-                inclusive=True,
-            )
-            msgs = hist.get("messages", []) or []
+            msgs = _recent_dm_messages(client, dm_channel)[:50]
             best = None
             best_activity = -1.0
             for m in msgs:
@@ -335,12 +445,7 @@ def build_slack_app() -> SlackApp:
         @return Optional[str]: Root thread timestamp if found
         """
         try:
-            hist = client.conversations_history(  # type: ignore[attr-defined]
-                channel=dm_channel,
-                limit=100,
-                inclusive=True,
-            )
-            msgs = hist.get("messages", []) or []
+            msgs = _recent_dm_messages(client, dm_channel)
             best_root = None
             best_activity = -1.0
             for m in msgs:
@@ -427,16 +532,59 @@ def build_slack_app() -> SlackApp:
         sess["linked_issue_key"] = issue_key
         sess["state"] = "ACTIVE"
         # remove from pending if present
-        if isinstance(sess.get("pending_incident_keys"), list):
-            sess["pending_incident_keys"] = [
-                k for k in sess["pending_incident_keys"] if k != issue_key
-            ]
+        sess.get("pending_incident_keys", {}).pop(issue_key, None)
         try:
             sess["updated_at"] = time.time()
         except Exception:
             pass
 
     # ===== Event: link_shared (auto-link ISO issues) =====
+    def _iter_workspace_users(client):
+        """
+        Yield all workspace members, following users.list pagination cursors.
+
+        @param client: Slack WebClient
+        @return Iterator[Dict[str, Any]]: Member objects
+        """
+        cursor: Optional[str] = None
+        while True:
+            resp = client.users_list(limit=USERS_LIST_PAGE_SIZE, cursor=cursor)  # type: ignore[attr-defined]
+            yield from resp.get("members", []) or []
+            cursor = (resp.get("response_metadata") or {}).get("next_cursor")
+            if not cursor:
+                return
+
+    def _lookup_user_id_by_name(client, name: str) -> str:
+        """
+        Resolve a Slack user's name to their id via a cached users.list snapshot.
+
+        @param client: Slack WebClient
+        @param name: Real name or display name
+        @return str: User id, or empty string if no user has that name
+        """
+        if time.time() >= USERS_CACHE["expires"]:
+            with USERS_CACHE_LOCK:
+                # Another event may have refreshed the cache while we waited
+                if time.time() >= USERS_CACHE["expires"]:
+                    by_name: Dict[str, str] = {}
+                    by_display_name: Dict[str, str] = {}
+                    for u in _iter_workspace_users(client):
+                        profile = u.get("profile", {}) or {}
+                        uid = str(u.get("id") or "")
+                        real_name = str(profile.get("real_name") or "")
+                        display_name = str(profile.get("display_name") or "")
+                        # First match wins, as in a linear scan
+                        if real_name:
+                            by_name.setdefault(real_name.lower(), uid)
+                        if display_name:
+                            by_display_name.setdefault(display_name.lower(), uid)
+                    # Real names take precedence over another member's display name
+                    for dn, uid in by_display_name.items():
+                        by_name.setdefault(dn, uid)
+                    USERS_CACHE["by_name"] = by_name
+                    USERS_CACHE["expires"] = time.time() + USERS_CACHE_TTL_SECONDS
+        return USERS_CACHE["by_name"].get(name.lower(), "")
+
     @app.event("link_shared")
     def handle_link_shared(event, logger, client):  # type: ignore
         """
@@ -447,16 +595,31 @@ def build_slack_app() -> SlackApp:
         Otherwise, open a DM to the reporter and create a WAITING_FOR_INCIDENT session
         with the ISO key in pending_incident_keys.
         """
-        logger.info(f"[incident-bot] link_shared event: {event}")
+        logger.debug("[incident-bot] link_shared event: %s", event)
         try:
             links = event.get("links", []) or []
+            # Only ISO issue links matter; skip the Slack lookups below for anything else
+            iso_key_found: Optional[str] = None
+            for link in links:
+                logger.debug("[incident-bot] link: %s", link)
+                url = str(link.get("url") or "")
+                # Cheap substring test first; most shared links are not Jira ISO links
+                if ISO_URL_MARKER not in url:
+                    continue
+                m = ISO_REGEX.search(url)
+                if m:
+                    iso_key_found = m.group(1)
+                    logger.info("[incident-bot] iso_key_found: %s", iso_key_found)
+                    break
+            if not iso_key_found:
+                return
             # Identify the reporter from the channel message text if possible
             user_id = ""
             channel_id = str(event.get("channel") or "")
             message_ts = str(event.get("message_ts") or "")
             # Try to fetch the original message to parse reporter mentions or names
-            logger.info(f"[incident-bot] channel_id: {channel_id}")
-            logger.info(f"[incident-bot] message_ts: {message_ts}")
+            logger.debug("[incident-bot] channel_id: %s", channel_id)
+            logger.debug("[incident-bot] message_ts: %s", message_ts)
             try:
                 if channel_id and message_ts:
                     hist = client.conversations_history(  # type: ignore[attr-defined]
@@ -469,30 +632,18 @@ def build_slack_app() -> SlackApp:
                     if msgs:
                         txt = str(msgs[0].get("text") or "")
                         # Prefer Slack user mentions like <@U123>
-                        muser = re.search(r"<@([UW][A-Z0-9]+)>", txt)
+                        muser = USER_MENTION_RE.search(txt)
                         if muser:
                             user_id = muser.group(1)
                         else:
                             # Fallback: parse 'Name heeft onder issue ...'
-                            mname = re.search(
-                                r"^([^\n]+?)\s+heeft\s+onder\s+issue\s+",
-                                txt,
-                                re.IGNORECASE,
-                            )
+                            mname = NAME_REPORTER_RE.match(txt)
                             if mname:
                                 display_name = mname.group(1).strip()
                                 try:
-                                    users = client.users_list(limit=200).get("members", [])  # type: ignore[attr-defined]
-                                    for u in users:
-                                        profile = u.get("profile", {}) or {}
-                                        dn = str(
-                                            profile.get("real_name")
-                                            or profile.get("display_name")
-                                            or ""
-                                        )
-                                        if dn and dn.lower() == display_name.lower():
-                                            user_id = str(u.get("id") or "")
-                                            break
+                                    user_id = _lookup_user_id_by_name(
+                                        client, display_name
+                                    )
                                 except Exception:
                                     pass
             except Exception:
@@ -500,38 +651,24 @@ def build_slack_app() -> SlackApp:
             # Fallback to the event user if reporter not found via text
             if not user_id:
                 user_id = str(event.get("user") or "")
-            iso_key_found: Optional[str] = None
-            for link in links:
-                logger.info(f"[incident-bot] link: {link}")
-                url = str(link.get("url") or "")
-                m = ISO_REGEX.search(url)
-                if m:
-                    iso_key_found = m.group(1)
-                    logger.info(f"[incident-bot] iso_key_found: {iso_key_found}")
-                    break
-            if not iso_key_found:
-                return
             if not user_id:
                 logger.info(
-                    f"[incident-bot] ISO {iso_key_found} shared but no user on event"
+                    "[incident-bot] ISO %s shared but no user on event", iso_key_found
                 )
                 return
 
             # Do NOT recreate a session here; only act on existing sessions
-            sess = SESSIONS.get(user_id)
-            logger.info(f"[incident-bot] sess: {sess}")
+            sess = STORE.get(user_id)
+            logger.debug("[incident-bot] sess: %s", sess)
 
             if not sess:
                 # No session or not waiting: start a DM and create a waiting session with pending
                 sess = _create_session(user_id)
                 dm = _ensure_dm_channel(client, user_id)
-                logger.info(f"[incident-bot] dm: {dm}")
+                logger.debug("[incident-bot] dm: %s", dm)
                 if dm:
                     sess["state"] = "WAITING_FOR_INCIDENT"
-                    pending = sess.get("pending_incident_keys") or []
-                    if iso_key_found not in pending:
-                        pending = list(pending) + [iso_key_found]
-                    sess["pending_incident_keys"] = pending
+                    sess["pending_incident_keys"].setdefault(iso_key_found, None)
                     try:
                         sess["updated_at"] = time.time()
                     except Exception:
@@ -585,10 +722,9 @@ def build_slack_app() -> SlackApp:
                     dm = _ensure_dm_channel(client, user_id)
                     if dm:
                         # Track as pending for later selection
-                        pending = list(sess.get("pending_incident_keys") or [])
+                        pending = sess["pending_incident_keys"]
                         if iso_key_found not in pending:
-                            pending.append(iso_key_found)
-                            sess["pending_incident_keys"] = pending
+                            pending[iso_key_found] = None
                             try:
                                 sess["updated_at"] = time.time()
                             except Exception:
@@ -614,7 +750,7 @@ def build_slack_app() -> SlackApp:
             thread_ts = str(
                 container.get("thread_ts") or container.get("message_ts") or ""
             )
-            logger.info(f"[incident-bot] thread_ts: {thread_ts}")
+            logger.debug("[incident-bot] thread_ts: %s", thread_ts)
             if dm and thread_ts:
                 _reply_in_given_thread_and_continue(client, dm, thread_ts, issue_key)
             elif dm:
@@ -685,19 +821,34 @@ def build_slack_app() -> SlackApp:
 
     # moved helpers are now imported from incident_agent.utils
 
-    def _send_form(thread_ts: str, say) -> None:  # type: ignore
+    def _send_form(thread_ts: str, say) -> Future:  # type: ignore
         """
         Send the form content as three consecutive messages.
 
+        Parts 2 and 3 are posted from timer threads FORM_PART_DELAY_SECONDS apart,
+        so the calling Slack handler returns immediately.
+
         @param thread_ts: Slack thread timestamp to reply in.
         @param say: Slack 'say' function used to send messages.
-        @return None
+        @return Future: Resolves once the last part has been sent.
         """
-        say(text=MSG.FORM_TEXT_PART_1, thread_ts=thread_ts)
-        time.sleep(2)
-        say(text=MSG.FORM_TEXT_PART_2, thread_ts=thread_ts)
-        time.sleep(2)
-        say(text=MSG.FORM_TEXT_PART_3, thread_ts=thread_ts)
+        sent: Future = Future()
+        parts = [MSG.FORM_TEXT_PART_1, MSG.FORM_TEXT_PART_2, MSG.FORM_TEXT_PART_3]
+
+        def _send_next() -> None:
+            try:
+                say(text=parts.pop(0), thread_ts=thread_ts)
+            except Exception as e:
+                log.warning("Failed to send form part: %s", e)
+            if parts:
+                timer = threading.Timer(FORM_PART_DELAY_SECONDS, _send_next)
+                timer.daemon = True
+                timer.start()
+            else:
+                sent.set_result(None)
+
+        _send_next()
+        return sent
 
     def _make_say_via_client(client, channel: str):
         """
@@ -708,8 +859,9 @@ def build_slack_app() -> SlackApp:
         @return Callable: function like say(text=..., thread_ts=...)
         """
 
-        def _say(*, text: str, thread_ts: str) -> None:
-            client.chat_postMessage(channel=channel, text=text, thread_ts=thread_ts)  # type: ignore[attr-defined]
+        def _say(*, text: str, thread_ts: str) -> Any:
+            # Return the response like say() does, so callers can chat_update the message
+            return client.chat_postMessage(channel=channel, text=text, thread_ts=thread_ts)  # type: ignore[attr-defined]
 
         return _say
 
@@ -724,11 +876,10 @@ def build_slack_app() -> SlackApp:
         @param say_like: Callable compatible with say(text=..., thread_ts=...)
         @param user_id: Slack user id to clear session for
         """
-        state.pop((channel, root_ts), None)
+        STORE.pop_conv(channel, root_ts)
         if user_id:
-            print(SESSIONS)
-            SESSIONS.pop(user_id, None)
-            print(SESSIONS)
+            STORE.pop(user_id)
+            log.debug("STORE after cancel: %s", STORE)
         say_like(text=MSG.incident_canceled(), thread_ts=root_ts)
 
     def _start_regular_flow(channel: str, root_ts: str, say_like) -> None:
@@ -740,25 +891,45 @@ def build_slack_app() -> SlackApp:
         @param say_like: Callable compatible with say(text=..., thread_ts=...)
         @return None
         """
-        _send_form(root_ts, say_like)
-        result = extractor.extract("")
-        state[(channel, root_ts)] = {
-            "data": result.data.model_dump(),
-            "questions": [q.model_dump() for q in result.questions],
-            "index": 0,
-            "status": "collecting",
-            "mode": "story",
-            "pending": None,
-            "confirm_action": None,
-        }
-        if result.questions:
-            total = len(result.questions)
-            say_like(
-                text=MSG.first_question(total, utils.q_display(result.questions[0])),
-                thread_ts=root_ts,
+        # Build the questionnaire in the background while the form is being sent
+        future = EXECUTOR.submit(extractor.initial_state)
+        form_sent = _send_form(root_ts, say_like)
+
+        def _on_extracted(done: Future) -> None:
+            try:
+                data, questions = done.result()
+            except Exception as e:
+                log.error("Error preparing questionnaire: %s", e)
+                say_like(text=MSG.could_not_process_message(), thread_ts=root_ts)
+                return
+            STORE.put_conv(
+                channel,
+                root_ts,
+                {
+                    "data": data,
+                    "filled": utils.filled_fields(data),
+                    "questions": questions,
+                    "index": 0,
+                    "status": "collecting",
+                    "mode": "story",
+                    "pending": None,
+                    "confirm_action": None,
+                },
             )
-        else:
-            say_like(text=MSG.no_open_questions_short(), thread_ts=root_ts)
+            if questions:
+                say_like(
+                    text=MSG.first_question(
+                        len(questions), utils.q_display(questions[0])
+                    ),
+                    thread_ts=root_ts,
+                )
+            else:
+                say_like(text=MSG.no_open_questions_short(), thread_ts=root_ts)
+
+        # Ask the first question once both the extraction and the form are done
+        future.add_done_callback(
+            lambda done: form_sent.add_done_callback(lambda _: _on_extracted(done))
+        )
 
     def _start_preface_flow(channel: str, root_ts: str, say_like) -> None:
         """
@@ -769,40 +940,242 @@ def build_slack_app() -> SlackApp:
         @param root_ts: Thread root timestamp
         @param say_like: Callable compatible with say(text=..., thread_ts=...)
         """
-        state[(channel, root_ts)] = {
-            "status": "preface",
-            "preface_index": 1,
-        }
+        STORE.put_conv(channel, root_ts, {"status": "preface", "preface_index": 1})
         say_like(text=MSG.PREFACE_TEXT, thread_ts=root_ts)
         sess = _get_session_for_channel(channel)
         say_like(text=MSG.preface_step_text(1, sess), thread_ts=root_ts)
 
-    def _send_closeout_with_followup(root_ts: str, say_like) -> None:
+    def _is_duplicate_message(event: Dict[str, Any]) -> bool:
+        """
+        Record a message's client_msg_id and report whether it was already seen.
+
+        Entries older than SEEN_MESSAGE_TTL_SECONDS are pruned on the way.
+
+        @param event: Slack event dict containing the message
+        @return bool: True when this delivery is a retry of a handled message
+        """
+        msg_id = event.get("client_msg_id")
+        if not msg_id:
+            return False
+        now = time.time()
+        with SEEN_MESSAGES_LOCK:
+            cutoff = now - SEEN_MESSAGE_TTL_SECONDS
+            # Insertion order is arrival order, so expired ids sit at the front
+            while SEEN_MESSAGES:
+                oldest = next(iter(SEEN_MESSAGES))
+                if SEEN_MESSAGES[oldest] > cutoff:
+                    break
+                del SEEN_MESSAGES[oldest]
+            if msg_id in SEEN_MESSAGES:
+                return True
+            SEEN_MESSAGES[msg_id] = now
+            return False
+
+    def _conv_lock(conv: Dict[str, Any]) -> threading.RLock:
+        """
+        Return the lock serialising work on one conversation.
+
+        Re-entrant because a background callback may run inline on the thread
+        that already holds it.
+
+        @param conv: Conversation state dict
+        @return threading.RLock: Lock stored on the conversation
+        """
+        return conv.setdefault("_lock", threading.RLock())
+
+    def _update_message(posted: Any, text: str) -> bool:
+        """
+        Replace the text of a message the bot posted earlier.
+
+        @param posted: Response of the say()/chat.postMessage call that posted it
+        @param text: New message text
+        @return bool: True if the message was updated
+        """
+        try:
+            channel = posted.get("channel") if posted else None
+            ts = posted.get("ts") if posted else None
+            if not channel or not ts:
+                return False
+            app.client.chat_update(channel=channel, ts=ts, text=text)
+            return True
+        except Exception as e:
+            log.error("Failed to update message: %s", e)
+            return False
+
+    def _propose_in_background(
+        conv: Dict[str, Any],
+        field: str,
+        user_text: str,
+        produce: Callable[[], str],
+        build_message: Callable[[str], str],
+        root_ts: str,
+        say_like,
+        commit: Optional[Callable[[str], None]] = None,
+    ) -> None:
+        """
+        Generate a proposal with the model off the event thread and post it when ready.
+
+        @param conv: Conversation state dict
+        @param field: Field the proposal is for
+        @param user_text: User input that started the proposal history
+        @param produce: Callable returning the proposed value (runs on EXECUTOR)
+        @param build_message: Builds the Slack message from the proposed value
+        @param root_ts: Thread root timestamp
+        @param say_like: Callable compatible with say(text=..., thread_ts=...)
+        @param commit: Stores the value as the pending proposal (runs under the
+            conversation lock); defaults to starting a fresh history
+        @return None
+        """
+        placeholder = say_like(text=MSG.generating_proposal(), thread_ts=root_ts)
+        future = EXECUTOR.submit(produce)
+
+        def _reply(text: str) -> None:
+            # Turn the placeholder into the reply; post a new message if it can't be edited
+            if not _update_message(placeholder, text):
+                say_like(text=text, thread_ts=root_ts)
+
+        def _on_done(done: Future) -> None:
+            try:
+                value = done.result()
+            except Exception as e:
+                log.error("Error generating proposal for %s: %s", field, e)
+                _reply(MSG.could_not_process_message())
+                return
+            with _conv_lock(conv):
+                if commit is not None:
+                    commit(value)
+                else:
+                    utils.set_pending_with_history(conv, field, user_text, value)
+            _reply(build_message(value))
+
+        future.add_done_callback(_on_done)
+
+    def _propose_confirmation_for_field(
+        conv: Dict[str, Any], field: str, root_ts: str, say_like
+    ) -> None:
+        """
+        Propose a (reformulated) value for an already filled field and request confirmation.
+
+        In story mode the reformulation runs on the background executor.
+
+        @param conv: Conversation state dict
+        @param field: Field to propose
+        @param root_ts: Thread root timestamp
+        @param say_like: Callable compatible with say(text=..., thread_ts=...)
+        @return None
+        """
+        current_value = conv.get("data", {}).get(field, "")
+        text = str(current_value)
+        label = DUTCH_FIELD_LABELS.get(field, field)
+        if utils.is_filled(current_value) and conv.get("mode", "story") == "story":
+            data = dict(conv["data"])
+            _propose_in_background(
+                conv,
+                field,
+                text,
+                lambda: utils.rewrite_with_model(extractor, text, field, data),
+                lambda value: MSG.proposal(label, value),
+                root_ts,
+                say_like,
+            )
+            return
+        utils.set_pending_with_history(conv, field, text, text)
+        say_like(text=MSG.proposal(label, text), thread_ts=root_ts)
+
+    def _say_pair(say_like, first: str, second: str, root_ts: str) -> None:
+        """
+        Send two related texts as one Slack message to save an API round-trip.
+
+        @param say_like: Callable compatible with say(text=..., thread_ts=...)
+        @param first: First text (e.g. a command result)
+        @param second: Second text (e.g. the next step)
+        @param root_ts: Thread root timestamp
+        """
+        say_like(text=f"{first}\n\n{second}", thread_ts=root_ts)
+
+    def _send_closeout_with_followup(
+        root_ts: str, say_like, lead: Optional[str] = None
+    ) -> None:
         """
         Send the standard closeout message and follow-up steps together.
 
         @param root_ts: Thread root timestamp
         @param say_like: Callable compatible with say(text=..., thread_ts=...)
+        @param lead: Optional text to put before the closeout in the same message
         """
-        say_like(text=MSG.no_open_questions_with_jira(), thread_ts=root_ts)
-        say_like(text=MSG.FOLLOWUP_STEPS_TEXT, thread_ts=root_ts)
+        closeout = MSG.no_open_questions_with_jira()
+        if lead:
+            closeout = f"{lead}\n\n{closeout}"
+        _say_pair(say_like, closeout, MSG.FOLLOWUP_STEPS_TEXT, root_ts)
 
     # _to_adf and _to_adf_desc moved to incident_agent.utils
 
+    def _get_jira_client() -> JiraClient:
+        """
+        Return the shared JiraClient, creating it on first use.
+
+        Configuration errors propagate and are retried on the next call.
+
+        @return JiraClient: Shared client
+        """
+        jc = JIRA["client"]
+        if jc is None:
+            with JIRA_LOCK:
+                jc = JIRA["client"]
+                if jc is None:
+                    jc = JIRA["client"] = JiraClient()
+                    atexit.register(jc.close)
+        return jc
+
+    def _safe_attach(
+        jc: JiraClient,
+        key: str,
+        filename: str,
+        md: str,
+        conv: Dict[str, Any],
+        marker: Tuple[str, str],
+    ) -> None:
+        """
+        Attach the markdown report to a Jira issue, logging instead of raising on failure.
+
+        On success the marker is stored on the conversation as "last_attached", so an
+        unchanged report is not re-uploaded; either way the in-flight "attaching"
+        marker set by the submitter is cleared.
+
+        @param jc: Jira client
+        @param key: Issue key
+        @param filename: Attachment filename
+        @param md: Markdown content
+        @param conv: Conversation state dict to record the upload on
+        @param marker: (issue key, markdown digest) of this upload
+        @return None
+        """
+        ok = True
+        try:
+            jc.attach_markdown(key, filename, md)
+        except Exception as e:
+            log.warning("Failed to attach markdown to %s: %s", key, e)
+            ok = False
+        with _conv_lock(conv):
+            if ok:
+                conv["last_attached"] = marker
+            if conv.get("attaching") == marker:
+                conv["attaching"] = None
+
+    def _md_digest(md: str) -> str:
+        return hashlib.blake2b(md.encode("utf-8"), digest_size=16).hexdigest()
+
     def _post_to_jira(conv: Dict[str, Any], event: Dict[str, Any], root_ts: str, say, only_update: bool = False) -> None:  # type: ignore
         """
         Create or update Jira issue from the current conversation state.
 
         If a linked issue exists in the user's session, update it; otherwise create
         a new issue unless only_update=True.
+
+        Called with the conversation lock held: the payload is built from the state
+        here, and the Jira requests then run on EXECUTOR after the caller releases it.
         """
         try:
-            # Build Jira post components using message builder
-            built = MSG.create_jira_post(conv)
-            md = built["md"]
-            description_text = built["description_text"]
-            extra_fields = built["extra_fields"]
-
             # Try to resolve the linked issue key from the session
             linked_key: Optional[str] = None
             try:
@@ -818,8 +1191,48 @@ def build_slack_app() -> SlackApp:
             except Exception:
                 linked_key = None
 
-            jc = JiraClient()
+            # Build Jira post components using message builder
+            built = MSG.create_jira_post(conv)
+            md = built["md"]
+            description_text = built["description_text"]
+            extra_fields = built["extra_fields"]
+
+            jc = _get_jira_client()
 
+            def _attach_in_background(key: str) -> None:
+                # The attachment only needs the key; upload it without holding up the reply.
+                # Skip it when this exact report is already attached to the issue or its
+                # upload is still running; the marker is claimed under the lock so two
+                # quick posts cannot both submit it.
+                marker = (key, _md_digest(md))
+                with _conv_lock(conv):
+                    if marker in (conv.get("last_attached"), conv.get("attaching")):
+                        return
+                    conv["attaching"] = marker
+                ATTACH_EXECUTOR.submit(
+                    _safe_attach, jc, key, "incident.md", md, conv, marker
+                )
+
+            # Nothing to send if this issue already holds the current answers; an
+            # earlier attachment upload may still have failed, so retry that
+            digest = utils.data_digest(conv)
+            if linked_key and conv.get("last_posted") == (linked_key, digest):
+                _attach_in_background(linked_key)
+                say(text=MSG.jira_unchanged(linked_key), thread_ts=root_ts)
+                return
+            if not linked_key and only_update:
+                # Nothing to do if we're only allowed to update
+                return
+            # A second post while one is running could create a duplicate issue
+            if conv.get("jira_in_flight"):
+                say(text=MSG.jira_in_progress(), thread_ts=root_ts)
+                return
+            conv["jira_in_flight"] = True
+        except Exception as e:
+            say(text=MSG.could_not_create_jira(e), thread_ts=root_ts)
+            return
+
+        def _send() -> str:
             if linked_key:
                 update_fields: Dict[str, Any] = {}
                 if description_text:
@@ -828,28 +1241,167 @@ def build_slack_app() -> SlackApp:
                     update_fields.update(extra_fields)
                 if update_fields:
                     jc.update_issue(linked_key, update_fields)
-                key = linked_key
-            else:
-                if only_update:
-                    # Nothing to do if we're only allowed to update
-                    return
-                issue = jc.create_issue(
-                    summary="Security incident",
-                    description=description_text or "",
-                    extra_fields=extra_fields or None,
-                )
-                key = issue.get("key") or issue.get("id") or "(unknown)"
+                return linked_key
+            issue = jc.create_issue(
+                summary="Security incident",
+                description=description_text or "",
+                extra_fields=extra_fields or None,
+            )
+            return str(issue.get("key") or issue.get("id") or "(unknown)")
+
+        def _on_sent(done: Future) -> None:
             try:
-                jc.attach_markdown(str(key), "incident.md", md)
-            except Exception:
-                pass
+                key = done.result()
+            except Exception as e:
+                with _conv_lock(conv):
+                    conv["jira_in_flight"] = False
+                say(text=MSG.could_not_create_jira(e), thread_ts=root_ts)
+                return
+            with _conv_lock(conv):
+                conv["jira_in_flight"] = False
+                if linked_key:
+                    conv["last_posted"] = (linked_key, digest)
+            # Only attach once the post went through; a failed post uploads nothing
+            _attach_in_background(key)
             if linked_key:
-                say(text=MSG.jira_updated(str(key)), thread_ts=root_ts)
+                say(text=MSG.jira_updated(key), thread_ts=root_ts)
             else:
-                say(text=MSG.jira_created(str(key)), thread_ts=root_ts)
+                say(text=MSG.jira_created(key), thread_ts=root_ts)
+
+        # The Jira calls run without the conversation lock, so other messages in
+        # this thread are not held up by Jira latency
+        EXECUTOR.submit(_send).add_done_callback(_on_sent)
+
+    # ===== Thread-level commands =====
+    # Each handler takes (conv, text, text_raw, event, root_ts, say).
+
+    def _cmd_help(conv, text, text_raw, event, root_ts, say) -> None:  # type: ignore
+        say(text=MSG.HELP_TEXT, thread_ts=root_ts)
+
+    def _confirm_or_proceed(conv: Dict[str, Any], action: str, root_ts: str, say) -> bool:  # type: ignore
+        """
+        Ask for confirmation before finalize/jira while answers are incomplete.
+
+        @param conv: Conversation state dict
+        @param action: One of CONFIRM_ACTIONS
+        @param root_ts: Thread root timestamp
+        @param say: Slack 'say' function
+        @return bool: True if the caller may proceed with the action
+        """
+        questions = conv.get("questions", [])
+        pending = conv.get("pending") or {}
+        has_pending = isinstance(pending, dict) and pending.get("field")
+        incomplete = bool(has_pending) or (conv.get("index", 0) < len(questions))
+        if incomplete and not conv.pop("override_incomplete", False):
+            conv["confirm_action"] = action
+            say(text=MSG.warning_incomplete(action), thread_ts=root_ts)
+            return False
+        return True
+
+    def _cmd_finalize(conv, text, text_raw, event, root_ts, say) -> None:  # type: ignore
+        try:
+            if not _confirm_or_proceed(conv, "finalize", root_ts, say):
+                return
+            md = utils.rendered(conv)
+            say(text=MSG.final_document(md), thread_ts=root_ts)
+        except Exception as e:
+            say(text=MSG.could_not_generate_final_document(e), thread_ts=root_ts)
+
+    def _cmd_jira(conv, text, text_raw, event, root_ts, say) -> None:  # type: ignore
+        try:
+            if not _confirm_or_proceed(conv, "jira", root_ts, say):
+                return
+            _post_to_jira(conv, event, root_ts, say)
         except Exception as e:
             say(text=MSG.could_not_create_jira(e), thread_ts=root_ts)
 
+    def _cmd_status(conv, text, text_raw, event, root_ts, say) -> None:  # type: ignore
+        _say_pair(say, utils.format_status(conv), utils.next_step_text(conv), root_ts)
+
+    def _cmd_fields(conv, text, text_raw, event, root_ts, say) -> None:  # type: ignore
+        _say_pair(
+            say, utils.format_fields_list(conv), utils.next_step_text(conv), root_ts
+        )
+
+    def _cmd_show(conv, text, text_raw, event, root_ts, say) -> None:  # type: ignore
+        md = utils.rendered(conv)
+        _say_pair(say, MSG.current_markdown(md), utils.next_step_text(conv), root_ts)
+
+    def _cmd_continue(conv, text, text_raw, event, root_ts, say) -> None:  # type: ignore
+        say(text=utils.next_step_text(conv), thread_ts=root_ts)
+
+    def _cmd_showmode(conv, text, text_raw, event, root_ts, say) -> None:  # type: ignore
+        say(
+            text=MSG.current_input_mode(conv.get("mode", "story")),
+            thread_ts=root_ts,
+        )
+
+    def _cmd_mode(conv, text, text_raw, event, root_ts, say) -> None:  # type: ignore
+        try:
+            parts = text.split(" ", 1)
+            choice = parts[1].strip().lower()
+            if choice not in utils.MODE_WORDS:
+                raise ValueError
+            conv["mode"] = choice
+            # After confirming mode change, show the next question
+            _say_pair(
+                say, MSG.input_mode_set(choice), utils.next_step_text(conv), root_ts
+            )
+        except Exception:
+            say(text=MSG.usage_mode(), thread_ts=root_ts)
+
+    def _cmd_edit(conv, text, text_raw, event, root_ts, say) -> None:  # type: ignore
+        # edit <field> <value>  (accept optional 'story'/'literal' prefixes with space or colon)
+        try:
+            m = EDIT_RE.match(text_raw)
+            if not m:
+                raise ValueError
+            field_token, new_value = m.groups()
+            key = utils.resolve_field_key(field_token)
+            if not key:
+                say(text=MSG.unknown_field(field_token), thread_ts=root_ts)
+                return
+            forced, nv_body = utils.parse_mode_prefix(new_value)
+            mode_to_use = forced or conv.get("mode", "story")
+            if mode_to_use == "story":
+                # Propose and confirm
+                label = DUTCH_FIELD_LABELS.get(key, key)
+                data = dict(conv["data"])
+                _propose_in_background(
+                    conv,
+                    key,
+                    nv_body,
+                    lambda: utils.rewrite_with_model(extractor, nv_body, key, data),
+                    lambda value: MSG.proposal_edit(label, value),
+                    root_ts,
+                    say,
+                )
+            else:
+                utils.set_field(conv, key, nv_body)
+                say(text=MSG.changed_field(key), thread_ts=root_ts)
+        except Exception:
+            say(text=MSG.usage_edit_example(), thread_ts=root_ts)
+
+    # Exact-match keywords → handler, built once per app
+    COMMANDS: Dict[str, Callable[..., None]] = {}
+    for keywords, handler in (
+        (CMD_HELP, _cmd_help),
+        (CMD_FINALIZE, _cmd_finalize),
+        (CMD_JIRA, _cmd_jira),
+        (CMD_STATUS, _cmd_status),
+        (CMD_FIELDS, _cmd_fields),
+        (CMD_SHOW, _cmd_show),
+        (CMD_CONTINUE, _cmd_continue),
+        (CMD_SHOWMODE, _cmd_showmode),
+    ):
+        for keyword in keywords:
+            COMMANDS[keyword] = handler
+    # Commands that take arguments, matched on their leading token
+    PREFIX_COMMANDS: Tuple[Tuple[Tuple[str, ...], Callable[..., None]], ...] = (
+        (MODE_PREFIXES, _cmd_mode),
+        (EDIT_PREFIXES, _cmd_edit),
+    )
+
     # App Home rendering helpers moved to incident_agent.utils
 
     @app.event("app_home_opened")
@@ -866,288 +1418,95 @@ def build_slack_app() -> SlackApp:
             user_id = event.get("user")
             if not user_id:
                 return
-            logger.info(f"[incident-bot] app_home_opened by user={user_id}")
+            logger.info("[incident-bot] app_home_opened by user=%s", user_id)
             view = utils.build_home_view()
             client.views_publish(user_id=user_id, view=view)
         except Exception as e:
             logger.error(f"Failed to publish App Home: {e}")
 
-    @app.event("message")
-    def handle_message_events(body, say, event, logger, client):  # type: ignore
+    def _handle_thread_message(conv: Dict[str, Any], event: Dict[str, Any], text: str, text_raw: str, channel: str, root_ts: str, say, client) -> None:  # type: ignore
         """
-        Handle direct message events to guide the incident reporting flow.
+        Handle a message in a thread that already has conversation state.
 
-        @param body: Full request body.
-        @param say: Slack responder function for posting messages.
-        @param event: Slack event dict containing the message.
-        @param logger: Logger instance.
-        @param client: Slack WebClient.
-        @return None: Manages conversation state and responds in-thread.
+        @param conv: Conversation state dict
+        @param event: Slack event dict containing the message
+        @param text: Lowercased message text
+        @param text_raw: Stripped message text
+        @param channel: Channel id
+        @param root_ts: Thread root timestamp
+        @param say: Slack 'say' function
+        @param client: Slack WebClient
+        @return None
         """
-        # Ignore bot messages to avoid loops
-        if event.get("bot_id") or event.get("subtype") == "bot_message":
-            return
-
-        channel_type = event.get("channel_type")  # only handle DMs
-        if channel_type != "im":
-            return
-
-        channel = str(event.get("channel"))
-        has_thread = bool(event.get("thread_ts"))
-        root_ts = str(event.get("thread_ts") or event.get("ts"))
-        user_id = str(event.get("user") or "")
-
-        text_raw = (event.get("text") or "").strip()
-        text = text_raw.lower()
-
-        # Early-catch cancel before touching sessions to avoid recreating one
-        if text in {"cancel", "/cancel"}:
-            _cancel_thread_and_session(channel, root_ts, say, user_id)
-            return
-
-        # Track user's DM channel in session for later proactive messages
-        if user_id:
-            _set_session_dm(user_id, channel)
-
-        conv = state.get((channel, root_ts))
-
-        # cancel handled earlier
-
-        # In new DM messages (no thread), do not map to old threads and do not process commands:
-        # every new message starts its own conversation.
-
-        # If no conversation context found in DM
-        if not conv:
-            # If the user has pending incidents, offer a picker at DM start
-            if user_id:
-                prev_sess = _get_or_create_session(user_id)
-                pending = list(prev_sess.get("pending_incident_keys") or [])
-            sess = _create_session(user_id)
-            if pending:
-                options = [
-                    {"text": {"type": "plain_text", "text": k}, "value": k}
-                    for k in pending
-                ]
-                say(
-                    text="Je hebt eerder incidenten gemeld. Wil je er een koppelen?",
-                    blocks=[
-                        {
-                            "type": "section",
-                            "block_id": "pending_picker",
-                            "text": {
-                                "type": "mrkdwn",
-                                "text": "Kies een incident om te koppelen",
-                            },
-                            "accessory": {
-                                "type": "static_select",
-                                "action_id": "pick_pending_incident",
-                                "placeholder": {
-                                    "type": "plain_text",
-                                    "text": "Selecteer incident",
-                                },
-                                "options": options,
-                            },
-                        }
-                    ],
-                    thread_ts=root_ts,
-                )
-                time.sleep(3)
-
-            # In a DM without a thread: initialize preface flow anchored to this message
-            if not has_thread:
-                print(
-                    f"[incident-bot] New DM conversation: channel={channel} root_ts={root_ts}"
-                )
-                print(sess)
-                _start_preface_flow(channel, root_ts, say)
-                return
-            # If user types 'start' as a thread reply, initialize and start at question 1
-            else:
-                if text in {"start", "/start"}:
-                    _start_regular_flow(channel, root_ts, say)
-                    return
-                else:
-                    sess = _get_or_create_session(user_id)
-                    say(
-                        text=MSG.preface_step_text(len(MSG.PREFACE_STEPS), sess),
-                        thread_ts=root_ts,
-                    )
-                    return
-
         # Handle preface/form confirmation flow
         if conv.get("status") in {"preface", "form"}:
             _handle_chat_flow(conv, text, text_raw, channel, root_ts, say, client)
             return
 
+        # Classify the reply once for the confirmation branches below
+        kind, rest = utils.classify(text_raw)
+        accepted = kind in utils.ACCEPT_KINDS
+
         # If we are awaiting a confirmation to proceed with a risky action (finalize/jira)
         confirm_action = conv.get("confirm_action")
-        if confirm_action in {"finalize", "jira"}:
-            if utils.is_accept(text_raw):
+        if confirm_action in CONFIRM_ACTIONS:
+            if accepted:
                 # User confirmed to proceed; clear flag and continue as if they typed the action again
                 conv["confirm_action"] = None
                 conv["override_incomplete"] = True
                 text = confirm_action
-            elif utils.is_no(text_raw):
+            elif kind == "no":
                 conv["confirm_action"] = None
-                say(text=MSG.next_step_text(conv), thread_ts=root_ts)
+                say(text=utils.next_step_text(conv), thread_ts=root_ts)
                 return
             else:
                 say(
                     text=(
                         MSG.proceed_or_cancel_instruction()
                         + " "
-                        + MSG.next_step_text(conv)
+                        + utils.next_step_text(conv)
                     ),
                     thread_ts=root_ts,
                 )
                 return
 
         # Thread-level commands
-        if text in {"help", "/help"}:
-            say(text=MSG.HELP_TEXT, thread_ts=root_ts)
-            return
-        if text in {
-            "finaliseer",
-            "finaliseren",
-            "finalize",
-            "finaliseren aub",
-            "finalise",
-        }:
-            try:
-                questions = conv.get("questions", [])
-                pending = conv.get("pending") or {}
-                has_pending = isinstance(pending, dict) and pending.get("field")
-                incomplete = bool(has_pending) or (
-                    conv.get("index", 0) < len(questions)
-                )
-                if incomplete and not conv.pop("override_incomplete", False):
-                    conv["confirm_action"] = "finalize"
-                    say(
-                        text=MSG.warning_incomplete("finalize"),
-                        thread_ts=root_ts,
-                    )
-                    return
-                md = render_markdown(IncidentTemplate(**conv.get("data", {})))
-                say(text=MSG.final_document(md), thread_ts=root_ts)
-            except Exception as e:
-                say(text=MSG.could_not_generate_final_document(e), thread_ts=root_ts)
-            return
-        # (Removed) update existing Jira issue flow per request
-
-        if text in {"jira", "/jira"}:
-            try:
-                questions = conv.get("questions", [])
-                pending = conv.get("pending") or {}
-                has_pending = isinstance(pending, dict) and pending.get("field")
-                incomplete = bool(has_pending) or (
-                    conv.get("index", 0) < len(questions)
-                )
-                if incomplete and not conv.pop("override_incomplete", False):
-                    conv["confirm_action"] = "jira"
-                    say(
-                        text=MSG.warning_incomplete("jira"),
-                        thread_ts=root_ts,
-                    )
-                    return
-                _post_to_jira(conv, event, root_ts, say)
-            except Exception as e:
-                say(text=MSG.could_not_create_jira(e), thread_ts=root_ts)
-            return
-        if text in {"status", "/status"}:
-            say(text=utils.format_status(conv), thread_ts=root_ts)
-            say(text=utils.next_step_text(conv), thread_ts=root_ts)
-            return
-        if text in {"fields", "/fields", "velden", "/velden"}:
-            say(text=utils.format_fields_list(conv), thread_ts=root_ts)
-            say(text=utils.next_step_text(conv), thread_ts=root_ts)
-            return
-        if text in {"show", "/show", "toon", "/toon", "preview", "/preview"}:
-            md = render_markdown(IncidentTemplate(**conv.get("data", {})))
-            say(text=MSG.current_markdown(md), thread_ts=root_ts)
-            say(text=utils.next_step_text(conv), thread_ts=root_ts)
-            return
-        if text in {"continue", "/continue", "verder", "/verder"}:
-            say(text=utils.next_step_text(conv), thread_ts=root_ts)
-            return
-        if text.startswith("mode ") or text.startswith("/mode "):
-            try:
-                parts = text.split(" ", 1)
-                choice = parts[1].strip().lower()
-                if choice not in {"literal", "story"}:
-                    raise ValueError
-                conv["mode"] = choice
-                say(text=MSG.input_mode_set(choice), thread_ts=root_ts)
-                # After confirming mode change, show the next question
-                say(text=utils.next_step_text(conv), thread_ts=root_ts)
-            except Exception:
-                say(text=MSG.usage_mode(), thread_ts=root_ts)
-            return
-        if text in {"showmode", "/showmode"}:
-            say(
-                text=MSG.current_input_mode(conv.get("mode", "story")),
-                thread_ts=root_ts,
+        command = COMMANDS.get(text)
+        if command is None:
+            command = next(
+                (fn for prefixes, fn in PREFIX_COMMANDS if text.startswith(prefixes)),
+                None,
             )
-            return
-        if (
-            text.startswith("edit ")
-            or text.startswith("/edit ")
-            or text.startswith("wijzig ")
-        ):
-            # edit <field> <value>  (accept optional 'story'/'literal' prefixes with space or colon)
-            try:
-                parts = text_raw.split(" ", 2)
-                if len(parts) < 3:
-                    raise ValueError
-                _, field_token, new_value = parts
-                key = utils.resolve_field_key(field_token)
-                if not key:
-                    say(text=MSG.unknown_field(field_token), thread_ts=root_ts)
-                    return
-                forced, nv_body = utils.parse_mode_prefix(new_value)
-                mode_to_use = forced or conv.get("mode", "story")
-                if mode_to_use == "story":
-                    value = utils.rewrite_with_model(
-                        extractor, nv_body, key, conv["data"]
-                    )  # propose and confirm
-                    utils.set_pending_with_history(conv, key, nv_body, value)
-                    label = DUTCH_FIELD_LABELS.get(key, key)
-                    say(text=MSG.proposal_edit(label, value), thread_ts=root_ts)
-                else:
-                    conv["data"][key] = nv_body
-                    say(text=MSG.changed_field(key), thread_ts=root_ts)
-            except Exception:
-                say(text=MSG.usage_edit_example(), thread_ts=root_ts)
-            return
-        if text in {"cancel", "/cancel"}:
-            _cancel_thread_and_session(channel, root_ts, say, user_id)
+        if command is not None:
+            command(conv, text, text_raw, event, root_ts, say)
             return
 
-        # Pending confirmation flow (only for story mode usage)
+        # Read the conversation fields the flows below need once
+        questions = conv.get("questions", [])
+        idx = conv.get("index", 0)
+        mode = conv.get("mode", "story")
         pending = conv.get("pending")
+
+        # Pending confirmation flow (only for story mode usage)
         if pending and isinstance(pending, dict) and pending.get("field"):
             field = pending["field"]
             label = DUTCH_FIELD_LABELS.get(field, field)
-            # For risicoafweging: if we don't have detail yet (candidate is empty or just yes), do not allow acceptance
-            if field == "risicoafweging":
-                _cand_now = (pending.get("candidate") or "").strip().lower()
-                if _cand_now in {"", "ja", "yes"} and utils.is_accept(text_raw):
-                    say(text=MSG.need_risk_assessment_detail(), thread_ts=root_ts)
-                    return
-            if utils.is_accept(text_raw):
+            # For risicoafweging: a candidate that is empty or just yes still needs its detail
+            awaiting_risk_detail = field == "risicoafweging" and utils.norm(
+                pending.get("candidate") or ""
+            ) in {"", "ja", "yes"}
+            # If we don't have the detail yet, do not allow acceptance
+            if awaiting_risk_detail and accepted:
+                say(text=MSG.need_risk_assessment_detail(), thread_ts=root_ts)
+                return
+            if accepted:
                 # Commit candidate and move on
-                conv["data"][field] = pending.get("candidate", "")
+                utils.set_field(conv, field, pending.get("candidate", ""))
                 conv["pending"] = None
-                # Advance to next question
-                idx = conv.get("index", 0)
-                questions = conv.get("questions", [])
                 # After confirming an auto-filled field, handle the autofill queue then proceed
-                queue = conv.get("autofill_queue") or []
-                # Remove the just-confirmed field from the queue
-                conv["autofill_queue"] = [f for f in queue if f != field]
-                if conv["autofill_queue"]:
-                    utils.propose_confirmation_for_field(
-                        extractor, conv, conv["autofill_queue"][0], root_ts, say
-                    )
+                next_field = utils.advance_autofill_queue(conv, field)
+                if next_field:
+                    _propose_confirmation_for_field(conv, next_field, root_ts, say)
                     return
                 # Otherwise proceed with the next unanswered question index
                 next_idx = utils.compute_next_index(conv, idx)
@@ -1164,40 +1523,44 @@ def build_slack_app() -> SlackApp:
             else:
                 # Special case: for risicoafweging, after a 'yes' we expect an additional detail.
                 # If no meaningful candidate yet ("" or "ja"/"yes"), treat this message as the detail
-                if field == "risicoafweging":
-                    cand_now = (pending.get("candidate") or "").strip().lower()
-                    if cand_now in {"", "ja", "yes"}:
-                        forced, detail_body = utils.parse_mode_prefix(text_raw)
-                        mode_to_use = forced or conv.get("mode", "story")
-                        detail_value = (
-                            utils.rewrite_with_model(
-                                extractor, detail_body, field, conv["data"]
-                            )
-                            if mode_to_use == "story"
-                            else detail_body
+                if awaiting_risk_detail:
+                    forced, detail_body = utils.parse_mode_prefix(text_raw)
+                    mode_to_use = forced or mode
+                    # Initialize per-field history starting from the yes + detail response and draft
+                    if mode_to_use == "story":
+                        data = dict(conv["data"])
+                        _propose_in_background(
+                            conv,
+                            field,
+                            text_raw,
+                            lambda: "yes: "
+                            + utils.rewrite_with_model(
+                                extractor, detail_body, field, data
+                            ),
+                            lambda value: MSG.proposal(label, value),
+                            root_ts,
+                            say,
                         )
-                        combined = f"yes: {detail_value}"
-                        # Initialize per-field history starting from the yes + detail response and draft
-                        utils.set_pending_with_history(conv, field, text_raw, combined)
-                        say(text=MSG.proposal(label, combined), thread_ts=root_ts)
                         return
+                    combined = f"yes: {detail_body}"
+                    utils.set_pending_with_history(conv, field, text_raw, combined)
+                    say(text=MSG.proposal(label, combined), thread_ts=root_ts)
+                    return
                 # Treat any non-accept, non-new input as revision instructions using per-field history
-                lower = text.strip().lower()
-                if lower.startswith("new ") or lower == "new":
-                    new_body = text_raw.split(" ", 1)[1] if " " in text_raw else ""
-                    forced, new_value_body = utils.parse_mode_prefix(new_body)
-                    mode_to_use = forced or conv.get("mode", "story")
+                if kind == "new":
+                    forced, new_value_body = utils.parse_mode_prefix(rest)
+                    mode_to_use = forced or mode
+                    if not new_value_body.strip():
+                        say(text=MSG.empty_answer(label), thread_ts=root_ts)
+                        return
                     if mode_to_use == "literal":
                         # Commit literal immediately, no confirmation (forced or current mode)
-                        conv["data"][field] = new_value_body
+                        utils.set_field(conv, field, new_value_body)
                         conv["pending"] = None
-                        idx = conv.get("index", 0)
-                        questions = conv.get("questions", [])
-                        queue = conv.get("autofill_queue") or []
-                        conv["autofill_queue"] = [f for f in queue if f != field]
-                        if conv["autofill_queue"]:
-                            utils.propose_confirmation_for_field(
-                                extractor, conv, conv["autofill_queue"][0], root_ts, say
+                        next_field = utils.advance_autofill_queue(conv, field)
+                        if next_field:
+                            _propose_confirmation_for_field(
+                                conv, next_field, root_ts, say
                             )
                             return
                         next_idx = utils.compute_next_index(conv, idx)
@@ -1213,46 +1576,66 @@ def build_slack_app() -> SlackApp:
                         else:
                             say(text=MSG.all_questions_answered(), thread_ts=root_ts)
                         return
-                    # Story mode: propose and require confirmation
-                    value = (
-                        utils.rewrite_with_model(
-                            extractor, new_value_body, field, conv["data"]
-                        )
-                        if mode_to_use == "story"
-                        else new_value_body
+                    # Story mode: propose and require confirmation. `new` rejects the
+                    # current draft, so ask the model again instead of reusing it.
+                    data = dict(conv["data"])
+                    _propose_in_background(
+                        conv,
+                        field,
+                        new_value_body,
+                        lambda: utils.rewrite_with_model(
+                            extractor, new_value_body, field, data, cache=False
+                        ),
+                        lambda value: MSG.proposal(label, value),
+                        root_ts,
+                        say,
                     )
-                    utils.set_pending_with_history(conv, field, new_value_body, value)
-                    say(text=MSG.proposal(label, value), thread_ts=root_ts)
                     return
                 # Otherwise, refine using history and the freeform instructions
-                history = pending.get("history") or []
+                history = list(pending.get("history") or [])
                 # Append latest user instruction
                 history.append({"role": "user", "content": text_raw})
-                revised = utils.revise_with_history(extractor, field, history, text_raw)
-                # Append assistant result and update pending
-                history.append({"role": "assistant", "content": revised})
-                conv["pending"] = {
-                    "field": field,
-                    "candidate": revised,
-                    "history": history,
-                }
-                say(text=MSG.proposal(label, revised), thread_ts=root_ts)
+
+                def _commit_revision(revised: str) -> None:
+                    # Append assistant result and update pending
+                    conv["pending"] = {
+                        "field": field,
+                        "candidate": revised,
+                        "history": utils.trim_history(
+                            history + [{"role": "assistant", "content": revised}]
+                        ),
+                    }
+
+                _propose_in_background(
+                    conv,
+                    field,
+                    text_raw,
+                    lambda: utils.revise_with_history(
+                        extractor, field, history, text_raw
+                    ),
+                    lambda value: MSG.proposal(label, value),
+                    root_ts,
+                    say,
+                    commit=_commit_revision,
+                )
                 return
 
         # If there are questions, consume next and request confirmation only in story mode
-        questions = conv.get("questions", [])
-        idx = conv.get("index", 0)
         if idx < len(questions):
             q = questions[idx]
             field = utils.q_field(q)
             if field:
                 forced, body_text = utils.parse_mode_prefix(text_raw)
-                mode_to_use = forced or conv.get("mode", "story")
+                mode_to_use = forced or mode
+                # Nothing to store or rewrite (e.g. just `story:`); ask again without a model call
+                if not body_text.strip() and field != "risicoafweging":
+                    say(text=MSG.empty_answer(utils.q_display(q)), thread_ts=root_ts)
+                    return
                 if field == "risicoafweging":
                     # Force yes/no; if invalid, reprompt without advancing
-                    yn = body_text.strip().lower()
-                    if utils.is_yes(yn):
-                        conv["data"][field] = "yes"
+                    yn = utils.norm(body_text)
+                    if yn in utils.YES_WORDS:
+                        utils.set_field(conv, field, "yes")
                         say(
                             text=MSG.risk_assessment_followup_question(),
                             thread_ts=root_ts,
@@ -1263,8 +1646,8 @@ def build_slack_app() -> SlackApp:
                             "candidate": conv["data"][field],
                         }
                         return
-                    elif utils.is_no(yn):
-                        conv["data"][field] = "no"
+                    elif yn in utils.NO_WORDS:
+                        utils.set_field(conv, field, "no")
                         # Move to next unanswered question
                         next_idx = utils.compute_next_index(conv, idx + 1)
                         conv["index"] = next_idx
@@ -1277,11 +1660,9 @@ def build_slack_app() -> SlackApp:
                                 thread_ts=root_ts,
                             )
                         else:
-                            say(
-                                text=MSG.all_questions_answered_thank_you(),
-                                thread_ts=root_ts,
+                            _send_closeout_with_followup(
+                                root_ts, say, lead=MSG.all_questions_answered_thank_you()
                             )
-                            _send_closeout_with_followup(root_ts, say)
                         return
                     else:
                         say(
@@ -1291,16 +1672,23 @@ def build_slack_app() -> SlackApp:
                         return
                 else:
                     if mode_to_use == "story":
-                        value = utils.rewrite_with_model(
-                            extractor, body_text, field, conv["data"]
-                        )
-                        utils.set_pending_with_history(conv, field, body_text, value)
                         label = DUTCH_FIELD_LABELS.get(field, field)
-                        say(text=MSG.proposal(label, value), thread_ts=root_ts)
+                        data = dict(conv["data"])
+                        _propose_in_background(
+                            conv,
+                            field,
+                            body_text,
+                            lambda: utils.rewrite_with_model(
+                                extractor, body_text, field, data
+                            ),
+                            lambda value: MSG.proposal(label, value),
+                            root_ts,
+                            say,
+                        )
                         return
                     else:
                         # Literal mode: commit and advance
-                        conv["data"][field] = body_text
+                        utils.set_field(conv, field, body_text)
                         conv["index"] = idx + 1
                         if conv["index"] < len(questions):
                             next_q = questions[conv["index"]]
@@ -1321,6 +1709,131 @@ def build_slack_app() -> SlackApp:
         # Fallback
         say(text=MSG.could_not_process_message(), thread_ts=root_ts)
 
+    @app.event("message")
+    def handle_message_events(body, say, event, logger, client):  # type: ignore
+        """
+        Handle direct message events to guide the incident reporting flow.
+
+        @param body: Full request body.
+        @param say: Slack responder function for posting messages.
+        @param event: Slack event dict containing the message.
+        @param logger: Logger instance.
+        @param client: Slack WebClient.
+        @return None: Manages conversation state and responds in-thread.
+        """
+        channel_type = event.get("channel_type")  # only handle DMs
+        if channel_type == "im":
+            # Any new DM message (user or bot, `cancel` included) can change the
+            # active thread, so drop the cached listing before any early return
+            with DM_HISTORY_CACHE_LOCK:
+                DM_HISTORY_CACHE.pop(str(event.get("channel")), None)
+
+        # Ignore bot messages to avoid loops
+        if event.get("bot_id") or event.get("subtype") == "bot_message":
+            return
+
+        if channel_type != "im":
+            return
+
+        # A redelivered event was already answered; replying again would duplicate
+        # the bot's messages and model calls
+        if _is_duplicate_message(event):
+            logger.info("Ignoring duplicate delivery of %s", event.get("client_msg_id"))
+            return
+
+        channel = str(event.get("channel"))
+        has_thread = bool(event.get("thread_ts"))
+        root_ts = str(event.get("thread_ts") or event.get("ts"))
+        user_id = str(event.get("user") or "")
+
+        # Normalise once per event; handlers receive both forms
+        text_raw = (event.get("text") or "").strip()
+        text = text_raw.lower()
+
+        # Early-catch cancel before touching sessions to avoid recreating one
+        if text in CMD_CANCEL:
+            _cancel_thread_and_session(channel, root_ts, say, user_id)
+            return
+
+        # Track user's DM channel in session for later proactive messages
+        if user_id:
+            _set_session_dm(user_id, channel)
+
+        conv = STORE.get_conv(channel, root_ts)
+
+        # cancel handled earlier
+
+        # In new DM messages (no thread), do not map to old threads and do not process commands:
+        # every new message starts its own conversation.
+
+        # If no conversation context found in DM
+        if not conv:
+            # If the user has pending incidents, offer a picker at DM start
+            if user_id:
+                prev_sess = _get_or_create_session(user_id)
+                pending = list(prev_sess.get("pending_incident_keys") or [])
+            sess = _create_session(user_id)
+            if pending:
+                options = [
+                    {"text": {"type": "plain_text", "text": k}, "value": k}
+                    for k in pending
+                ]
+                say(
+                    text="Je hebt eerder incidenten gemeld. Wil je er een koppelen?",
+                    blocks=[
+                        {
+                            "type": "section",
+                            "block_id": "pending_picker",
+                            "text": {
+                                "type": "mrkdwn",
+                                "text": "Kies een incident om te koppelen",
+                            },
+                            "accessory": {
+                                "type": "static_select",
+                                "action_id": "pick_pending_incident",
+                                "placeholder": {
+                                    "type": "plain_text",
+                                    "text": "Selecteer incident",
+                                },
+                                "options": options,
+                            },
+                        }
+                    ],
+                    thread_ts=root_ts,
+                )
+
+            def _continue() -> None:
+                # In a DM without a thread: initialize preface flow anchored to this message
+                if not has_thread:
+                    log.debug(
+                        "[incident-bot] New DM conversation: channel=%s root_ts=%s",
+                        channel,
+                        root_ts,
+                    )
+                    log.debug("session: %s", sess)
+                    _start_preface_flow(channel, root_ts, say)
+                # If user types 'start' as a thread reply, initialize and start at question 1
+                elif text in CMD_START:
+                    _start_regular_flow(channel, root_ts, say)
+                else:
+                    _remind_start(_get_or_create_session(user_id), root_ts, say)
+
+            if pending:
+                # Give the user a moment to read the picker without holding this handler
+                timer = threading.Timer(PENDING_PICKER_DELAY_SECONDS, _continue)
+                timer.daemon = True
+                timer.start()
+            else:
+                _continue()
+            return
+
+        # One message at a time per conversation; background proposal callbacks
+        # take the same lock before writing to it
+        with _conv_lock(conv):
+            _handle_thread_message(
+                conv, event, text, text_raw, channel, root_ts, say, client
+            )
+
     return app
 
 
@@ -1340,7 +1853,15 @@ def main() -> int:
         raise RuntimeError("Missing SLACK_APP_TOKEN (xapp- token) for Socket Mode")
 
     bolt_app = build_slack_app()
-    handler = SocketModeHandler(bolt_app, app_token)
+    STORE.start_sweeper()
+    # Worker threads processing Slack events concurrently (Bolt's default is 10)
+    concurrency = int(
+        os.environ.get("SLACK_SOCKET_CONCURRENCY") or DEFAULT_SOCKET_CONCURRENCY
+    )
+    # Model calls run on EXECUTOR; size it like the event workers it offloads
+    global EXECUTOR
+    EXECUTOR = ThreadPoolExecutor(max_workers=concurrency)
+    handler = SocketModeHandler(bolt_app, app_token, concurrency=concurrency)
     print("[incident-bot] Socket Mode handler starting...")
     handler.start()
     return 0
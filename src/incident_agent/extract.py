@@ -1,7 +1,7 @@
 from __future__ import annotations
 
 import os
-from typing import Any, Dict, List
+from typing import Any, Dict, List, Optional, Tuple
 
 from dotenv import load_dotenv
 from openai import OpenAI
@@ -52,6 +52,10 @@ class IncidentExtractor:
         self.client = client or OpenAI()
         env_model = os.environ.get("OPENAI_MODEL")
         self.model = model or env_model or "gpt-4o-mini"
+        # Memoized (data, questions) dump of the constant empty extraction
+        self._initial_state: Optional[Tuple[Dict[str, Any], List[Dict[str, Any]]]] = (
+            None
+        )
 
     def extract(self, description: str, temperature: float = 0) -> ExtractionResult:
         """
@@ -87,3 +91,21 @@ class IncidentExtractor:
 
         result.questions = questions_fixed
         return result
+
+    def initial_state(self) -> Tuple[Dict[str, Any], List[Dict[str, Any]]]:
+        """
+        Return the dumped template data and questions for a new conversation.
+
+        The empty-input extraction is constant, so it is built and dumped once per
+        extractor; callers receive fresh copies they are free to mutate.
+
+        @return Tuple[Dict[str, Any], List[Dict[str, Any]]]: (data, questions) as plain dicts.
+        """
+        if self._initial_state is None:
+            result = self.extract("")
+            self._initial_state = (
+                result.data.model_dump(),
+                [q.model_dump() for q in result.questions],
+            )
+        data, questions = self._initial_state
+        return dict(data), [dict(q) for q in questions]
@@ -1,9 +1,26 @@
 from __future__ import annotations
 
+import json
 import os
 from typing import Any, Dict, Optional
 
 import requests
+from requests.adapters import HTTPAdapter
+
+JSON_HEADERS = {"Content-Type": "application/json"}
+# Connection pool per host; the bot issues update/create and attach calls concurrently
+POOL_CONNECTIONS = 10
+POOL_MAXSIZE = 20
+
+
+def _json_dumps(obj: Any) -> bytes:
+    """
+    Encode a request payload to JSON bytes once, so retries resend the same body.
+
+    @param obj: JSON-serialisable payload.
+    @return bytes: UTF-8 encoded JSON.
+    """
+    return json.dumps(obj, ensure_ascii=False).encode("utf-8")
 
 
 class JiraClient:
@@ -51,6 +68,11 @@ class JiraClient:
             )
 
         self._session = requests.Session()
+        adapter = HTTPAdapter(
+            pool_connections=POOL_CONNECTIONS, pool_maxsize=POOL_MAXSIZE
+        )
+        self._session.mount("https://", adapter)
+        self._session.mount("http://", adapter)
         # Configure auth
         if self.pat:
             # Bearer token for Server/DC PAT
@@ -65,6 +87,14 @@ class JiraClient:
             )
         self._session.headers.update({"Accept": "application/json"})
 
+    def close(self) -> None:
+        """
+        Close the underlying HTTP session and its pooled connections.
+
+        @return None
+        """
+        self._session.close()
+
     def _api(self, path: str) -> str:
         """
         Join the base URL with a REST path.
@@ -170,12 +200,18 @@ class JiraClient:
         versions_to_try += [v for v in self._api_versions if v not in versions_to_try]
         # Try with possible context paths: given base_url, and base_url + '/jira' if not already containing it
         base_candidates = self._candidate_bases()
+        # Encode once; the body is identical for every version/base attempt
+        body = _json_dumps(payload)
         attempts: list[tuple[str, int, str]] = []  # (url, status, snippet)
         for base in base_candidates:
             for ver in versions_to_try:
                 url = f"{base.rstrip('/')}/rest/api/{ver}/issue"
                 resp = self._session.post(
-                    url, json=payload, timeout=30, allow_redirects=False
+                    url,
+                    data=body,
+                    headers=JSON_HEADERS,
+                    timeout=30,
+                    allow_redirects=False,
                 )
                 snippet = resp.text[:300] if resp.text else ""
                 if 300 <= resp.status_code < 400:
@@ -216,12 +252,17 @@ class JiraClient:
         )
         versions_to_try += [v for v in self._api_versions if v not in versions_to_try]
         base_candidates = self._candidate_bases()
+        body = _json_dumps({"fields": fields})
         attempts: list[tuple[str, int, str]] = []
         for base in base_candidates:
             for ver in versions_to_try:
                 url = f"{base.rstrip('/')}/rest/api/{ver}/issue/{issue_key}"
                 resp = self._session.put(
-                    url, json={"fields": fields}, timeout=30, allow_redirects=False
+                    url,
+                    data=body,
+                    headers=JSON_HEADERS,
+                    timeout=30,
+                    allow_redirects=False,
                 )
                 snippet = resp.text[:300] if resp.text else ""
                 if 300 <= resp.status_code < 400:
@@ -3,12 +3,30 @@ from typing import Dict
 from typing import Any, Optional
 
 from .schema import IncidentTemplate
-from .render import render_markdown
 from . import utils
 
 
 # ===== Slack/User-facing message builders =====
 
+# Fixed message templates, filled in with str.format by the builders below
+PROPOSAL_TMPL: str = (
+    "Proposal for {label}:\n{value}\n\n"
+    "Confirm with `yes`/`ok`, provide an alternative via `new <value>`"
+    ", or type instructions how to change it."
+)
+PROPOSAL_EDIT_TMPL: str = (
+    "Proposal for {label}:\n{value}\n\n"
+    "Confirm with `yes`/`ok`, provide an alternative via `new <value>` (optional `new literal:` or `new story:`), or type instructions how to change it.."
+)
+WARN_INCOMPLETE_TMPL: str = (
+    "Warning: You have not answered all the questions yet. "
+    "Are you sure you want to {act_text}? Reply `yes` to proceed or `no` to cancel and continue with the questions."
+)
+NO_OPEN_Q_TEXT: str = "No open questions left. Send `finalize` to finish."
+UNKNOWN_FIELD_TMPL: str = (
+    "Unknown field `{field_token}`. Use `fields` to see available fields."
+)
+
 
 def proposal(label: str, value: str) -> str:
     """
@@ -19,11 +37,17 @@ def proposal(label: str, value: str) -> str:
     :param include_mode_hint: Whether to include the optional literal/story hint
     :return: Slack-formatted message
     """
-    return (
-        f"Proposal for {label}:\n{value}\n\n"
-        "Confirm with `yes`/`ok`, provide an alternative via `new <value>`"
-        ", or type instructions how to change it."
-    )
+    return PROPOSAL_TMPL.format(label=label, value=value)
+
+
+def generating_proposal() -> str:
+    """Placeholder shown while the model drafts a proposal."""
+    return "Generating proposal…"
+
+
+def empty_answer(subject: str) -> str:
+    """Reprompt when a reply holds no text besides a mode prefix or `new`."""
+    return f"I did not receive any text to use. Please reply with your answer for: {subject}"
 
 
 def next_question(prefix: str, question_display: str) -> str:
@@ -40,7 +64,7 @@ def all_questions_answered() -> str:
 
 def no_open_questions_short() -> str:
     """Short message when there are no open questions."""
-    return "No open questions left. Send `finalize` to finish."
+    return NO_OPEN_Q_TEXT
 
 
 def no_open_questions_with_jira() -> str:
@@ -56,14 +80,8 @@ def warning_incomplete(action: str) -> str:
     Warning about incomplete answers before a risky action ('finalize' or 'jira').
     :param action: Either 'finalize' or 'jira'
     """
-    if action == "finalize":
-        act_text = "finalize"
-    else:
-        act_text = "create a Jira issue"
-    return (
-        "Warning: You have not answered all the questions yet. "
-        f"Are you sure you want to {act_text}? Reply `yes` to proceed or `no` to cancel and continue with the questions."
-    )
+    act_text = "finalize" if action == "finalize" else "create a Jira issue"
+    return WARN_INCOMPLETE_TMPL.format(act_text=act_text)
 
 
 def proceed_or_cancel_instruction() -> str:
@@ -160,36 +178,43 @@ FORM_TEXT_PART_3: str = (
 )
 
 
+def _render_preface_steps(steps: list[str]) -> tuple[str, ...]:
+    total = len(steps)
+    rendered: list[str] = []
+    for step_index, body in enumerate(steps, start=1):
+        if step_index < total:
+            rendered.append(
+                f"*Step {step_index}/{total}*\n{body}\n\n"
+                "Reply `yes` when completed to show the next step."
+            )
+        else:
+            rendered.append(
+                f"*Step {step_index}/{total}*\n{body}\n\n"
+                "Type `start` to begin the incident report."
+            )
+    return tuple(rendered)
+
+
+# Rendered step messages, without and with a linked issue (which skips step 2)
+PREFACE_STEP_TEXTS: Dict[bool, tuple[str, ...]] = {
+    False: _render_preface_steps(PREFACE_STEPS),
+    True: _render_preface_steps([s for i, s in enumerate(PREFACE_STEPS) if i != 1]),
+}
+
+
 def preface_step_text(step_index: int, session: Optional[Dict[str, Any]] = None) -> str:
     """
     Render the preface step message for a given 1-based step index.
 
     If the provided session has a linked issue, skip the second PREFACE step.
     """
-    # Build the effective steps list depending on session state
     try:
         has_linked_issue = bool((session or {}).get("linked_issue_key"))
     except Exception:
         has_linked_issue = False
 
-    steps = (
-        [s for i, s in enumerate(PREFACE_STEPS) if i != 1]
-        if has_linked_issue
-        else PREFACE_STEPS
-    )
-
-    total = len(steps)
-    step_index = max(1, min(step_index, total))
-    body = steps[step_index - 1]
-    if step_index < total:
-        return (
-            f"*Step {step_index}/{total}*\n{body}\n\n"
-            "Reply `yes` when completed to show the next step."
-        )
-    return (
-        f"*Step {step_index}/{total}*\n{body}\n\n"
-        "Type `start` to begin the incident report."
-    )
+    texts = PREFACE_STEP_TEXTS[has_linked_issue]
+    return texts[max(1, min(step_index, len(texts))) - 1]
 
 
 # ===== LLM prompt templates =====
@@ -410,6 +435,14 @@ def jira_updated(key: str) -> str:
     return f"Jira issue updated: {key}"
 
 
+def jira_in_progress() -> str:
+    return "A Jira update for this conversation is still running; please wait for it to finish."
+
+
+def jira_unchanged(key: str) -> str:
+    return f"Jira issue {key} is already up to date; nothing changed since the last update."
+
+
 def input_mode_set(choice: str) -> str:
     return f"Input mode set to: {choice}"
 
@@ -423,14 +456,11 @@ def current_input_mode(mode: str) -> str:
 
 
 def unknown_field(field_token: str) -> str:
-    return f"Unknown field `{field_token}`. Use `fields` to see available fields."
+    return UNKNOWN_FIELD_TMPL.format(field_token=field_token)
 
 
 def proposal_edit(label: str, value: str) -> str:
-    return (
-        f"Proposal for {label}:\n{value}\n\n"
-        "Confirm with `yes`/`ok`, provide an alternative via `new <value>` (optional `new literal:` or `new story:`), or type instructions how to change it.."
-    )
+    return PROPOSAL_EDIT_TMPL.format(label=label, value=value)
 
 
 def changed_field(key: str) -> str:
@@ -460,6 +490,52 @@ def could_not_process_message() -> str:
 # ===== Jira post creation helpers =====
 
 
+# Jira custom field → (section title, [(field key, subsection title), ...])
+JIRA_SECTIONS: list[tuple[str, str, list[tuple[str, str]]]] = [
+    (
+        "customfield_10061",
+        "2. Measures",
+        [
+            (
+                "maatregelen_beheersen_corrigeren",
+                "2.1 Measures to control and correct the deviation",
+            ),
+            ("aanpassen_consequenties", "2.2 Adjust consequences"),
+            (
+                "risicoafweging",
+                "2.3 Risk assessment If the deviation is of such a nature, a risk assessment must be made. Contact Mark, holder of the risk inventory",
+            ),
+        ],
+    ),
+    (
+        "customfield_10062",
+        "3. Analysis and removing causes",
+        [
+            ("oorzaak_ontstaan", "3.1 Cause of the deviation"),
+            ("gevolgen", "3.2 Consequences of the deviation"),
+            ("oorzaak_wegnemen", "3.3 Remove cause"),
+            ("elders_voorgedaan", "3.4 Could the deviation have occurred elsewhere"),
+            ("acties_elders", "3.5 Actions on deviation that occurred elsewhere"),
+        ],
+    ),
+    (
+        "customfield_10063",
+        "4. Assessment of measures taken This chapter will be filled once the JIRA actions are completed.",
+        [
+            ("doeltreffendheid", "4.1 Effectiveness of the measures taken"),
+            (
+                "actualisatie_risico",
+                "4.2 Update of risk inventory based on deviation (if applicable)",
+            ),
+            (
+                "aanpassing_kwaliteitssysteem",
+                "4.3 Adjustment to quality system (if applicable)",
+            ),
+        ],
+    ),
+]
+
+
 def create_jira_post(conv: Dict[str, Any]) -> Dict[str, Any]:
     """
     Build the Jira description, attachment markdown, and extra custom fields
@@ -470,108 +546,33 @@ def create_jira_post(conv: Dict[str, Any]) -> Dict[str, Any]:
       - description_text: short description text (Section 1 only)
       - extra_fields: mapping for customfield_10061/10062/10063 with ADF content
     """
+    # Validate through the model only here, right before submitting to Jira
     template = IncidentTemplate(**conv.get("data", {}))
-    md = render_markdown(template)
-    d = template.model_dump()
-
-    def val(key: str) -> str:
-        v = d.get(key)
-        return v.strip() if isinstance(v, str) else ""
+    md = utils.rendered(conv)
+    vals = {
+        k: (v.strip() if isinstance(v, str) else "")
+        for k, v in template.model_dump().items()
+    }
 
     # Description: Section 1 only
-    desc_text_lines: list[str] = []
-    if val("beschrijving_afwijking"):
-        desc_text_lines.append("# 1. Beschrijving afwijking")
-        desc_text_lines.append(val("beschrijving_afwijking"))
-    description_text = "\n".join(desc_text_lines) if desc_text_lines else ""
-
-    # Section 2 → customfield_10061
-    sec2_lines: list[str] = []
-    if any(
-        val(k)
-        for k in [
-            "maatregelen_beheersen_corrigeren",
-            "aanpassen_consequenties",
-            "risicoafweging",
-        ]
-    ):
-        sec2_lines.append("# 2. Measures")
-        if val("maatregelen_beheersen_corrigeren"):
-            sec2_lines.append("## 2.1 Measures to control and correct the deviation")
-            sec2_lines.append(val("maatregelen_beheersen_corrigeren"))
-        if val("aanpassen_consequenties"):
-            sec2_lines.append("## 2.2 Adjust consequences")
-            sec2_lines.append(val("aanpassen_consequenties"))
-        if val("risicoafweging"):
-            sec2_lines.append(
-                "## 2.3 Risk assessment If the deviation is of such a nature, a risk assessment must be made. Contact Mark, holder of the risk inventory"
-            )
-            sec2_lines.append(val("risicoafweging"))
-    sec2_text = "\n".join(sec2_lines)
-
-    # Section 3 → customfield_10062
-    sec3_lines: list[str] = []
-    if any(
-        val(k)
-        for k in [
-            "oorzaak_ontstaan",
-            "gevolgen",
-            "oorzaak_wegnemen",
-            "elders_voorgedaan",
-            "acties_elders",
-        ]
-    ):
-        sec3_lines.append("# 3. Analysis and removing causes")
-        if val("oorzaak_ontstaan"):
-            sec3_lines.append("## 3.1 Cause of the deviation")
-            sec3_lines.append(val("oorzaak_ontstaan"))
-        if val("gevolgen"):
-            sec3_lines.append("## 3.2 Consequences of the deviation")
-            sec3_lines.append(val("gevolgen"))
-        if val("oorzaak_wegnemen"):
-            sec3_lines.append("## 3.3 Remove cause")
-            sec3_lines.append(val("oorzaak_wegnemen"))
-        if val("elders_voorgedaan"):
-            sec3_lines.append("## 3.4 Could the deviation have occurred elsewhere")
-            sec3_lines.append(val("elders_voorgedaan"))
-        if val("acties_elders"):
-            sec3_lines.append("## 3.5 Actions on deviation that occurred elsewhere")
-            sec3_lines.append(val("acties_elders"))
-    sec3_text = "\n".join(sec3_lines)
-
-    # Section 4 → customfield_10063
-    sec4_lines: list[str] = []
-    if any(
-        val(k)
-        for k in [
-            "doeltreffendheid",
-            "actualisatie_risico",
-            "aanpassing_kwaliteitssysteem",
-        ]
-    ):
-        sec4_lines.append(
-            "# 4. Assessment of measures taken This chapter will be filled once the JIRA actions are completed."
-        )
-        if val("doeltreffendheid"):
-            sec4_lines.append("## 4.1 Effectiveness of the measures taken")
-            sec4_lines.append(val("doeltreffendheid"))
-        if val("actualisatie_risico"):
-            sec4_lines.append(
-                "## 4.2 Update of risk inventory based on deviation (if applicable)"
-            )
-            sec4_lines.append(val("actualisatie_risico"))
-        if val("aanpassing_kwaliteitssysteem"):
-            sec4_lines.append("## 4.3 Adjustment to quality system (if applicable)")
-            sec4_lines.append(val("aanpassing_kwaliteitssysteem"))
-    sec4_text = "\n".join(sec4_lines)
+    description = vals.get("beschrijving_afwijking", "")
+    description_text = (
+        f"# 1. Beschrijving afwijking\n{description}" if description else ""
+    )
 
+    # Sections 2/3/4 → their custom fields, only when at least one subsection is filled.
+    # ADF nodes are emitted directly rather than rendering markdown and re-parsing it.
     extra_fields: Dict[str, Any] = {}
-    if sec2_text:
-        extra_fields["customfield_10061"] = utils.to_adf(sec2_text)
-    if sec3_text:
-        extra_fields["customfield_10062"] = utils.to_adf(sec3_text)
-    if sec4_text:
-        extra_fields["customfield_10063"] = utils.to_adf(sec4_text)
+    for custom_field, title, subsections in JIRA_SECTIONS:
+        content: list[Dict[str, Any]] = []
+        for key, subtitle in subsections:
+            value = vals.get(key, "")
+            if value:
+                content.append(utils.adf_heading(2, subtitle))
+                utils.append_adf_lines(content, value)
+        if content:
+            content.insert(0, utils.adf_heading(1, title))
+            extra_fields[custom_field] = utils.adf_doc(content)
 
     return {
         "md": md,
@@ -1,81 +1,84 @@
 from __future__ import annotations
 
-from typing import Dict
+from typing import Any, Dict, Mapping
 
 from .schema import IncidentTemplate
 
+# Document layout with one `{field}` slot per template field, filled with
+# str.format_map. Numbering is kept exact but headings are in English.
+_MD_TEMPLATE: str = "\n".join(
+    [
+        "# 1. Description of deviation",
+        "{beschrijving_afwijking}",
+        "",
+        "# 2. Measures",
+        "",
+        "## 2.1 Measures to control and correct the deviation",
+        "{maatregelen_beheersen_corrigeren}",
+        "",
+        "## 2.2 Adjust consequences",
+        "{aanpassen_consequenties}",
+        "",
+        "## 2.3 Risk assessment If the deviation is of such a nature, a risk assessment must be made. Contact Mark, holder of the risk inventory",
+        "{risicoafweging}",
+        "",
+        "# 3. Analysis and removing causes",
+        "",
+        "## 3.1 Cause of the deviation",
+        "{oorzaak_ontstaan}",
+        "",
+        "## 3.2 Consequences of the deviation",
+        "{gevolgen}",
+        "",
+        "## 3.3 Remove cause",
+        "{oorzaak_wegnemen}",
+        "",
+        "## 3.4 Could the deviation have occurred elsewhere",
+        "{elders_voorgedaan}",
+        "",
+        "## 3.5 Actions on deviation that occurred elsewhere",
+        "{acties_elders}",
+        "",
+        "# 4. Assessment of measures taken This chapter will be filled once the JIRA actions are completed.",
+        "",
+        "## 4.1 Effectiveness of the measures taken",
+        "{doeltreffendheid}",
+        "",
+        "## 4.2 Update of risk inventory based on deviation (if applicable)",
+        "{actualisatie_risico}",
+        "",
+        "## 4.3 Adjustment to quality system (if applicable)",
+        "{aanpassing_kwaliteitssysteem}",
+        "",
+        "# 5. Lessons learned",
+        "{leerpunten}",
+        "",
+        "# 6. Relation to ISO 27001 Annex A controls",
+        "{relatie_iso27001_annex_a}",
+    ]
+)
+_TEMPLATE_FIELDS: tuple[str, ...] = tuple(IncidentTemplate.model_fields)
 
-def render_markdown(template: IncidentTemplate) -> str:
+
+def render_markdown_from_dict(data: Mapping[str, Any]) -> str:
     """
-    Render a human-readable markdown document from the incident template fields.
+    Render the markdown document straight from a field dict, without model validation.
 
-    @param template: Pydantic model with incident fields (may contain empty strings/None).
+    @param data: Mapping of template field keys to values (missing/None/non-str → empty).
     @return str: Markdown string with numbered headings and filled sections.
     """
-    d: Dict[str, str | None] = template.model_dump()
-
-    def val(key: str) -> str:
-        """
-        Retrieve a trimmed value for a given field key (empty if None).
+    values: Dict[str, str] = {}
+    for key in _TEMPLATE_FIELDS:
+        value = data.get(key)
+        values[key] = value.strip() if isinstance(value, str) else ""
+    return _MD_TEMPLATE.format_map(values)
 
-        @param key: Field key in the template.
-        @return str: Trimmed string value or empty string.
-        """
-        value = d.get(key)
-        return value.strip() if isinstance(value, str) else ""
 
-    # Keep exact numbering but translate headings to English
-    lines = []
-    lines.append("# 1. Description of deviation")
-    lines.append(val("beschrijving_afwijking"))
-    lines.append("")
-    lines.append("# 2. Measures")
-    lines.append("")
-    lines.append("## 2.1 Measures to control and correct the deviation")
-    lines.append(val("maatregelen_beheersen_corrigeren"))
-    lines.append("")
-    lines.append("## 2.2 Adjust consequences")
-    lines.append(val("aanpassen_consequenties"))
-    lines.append("")
-    lines.append(
-        "## 2.3 Risk assessment If the deviation is of such a nature, a risk assessment must be made. Contact Mark, holder of the risk inventory"
-    )
-    lines.append(val("risicoafweging"))
-    lines.append("")
-    lines.append("# 3. Analysis and removing causes")
-    lines.append("")
-    lines.append("## 3.1 Cause of the deviation")
-    lines.append(val("oorzaak_ontstaan"))
-    lines.append("")
-    lines.append("## 3.2 Consequences of the deviation")
-    lines.append(val("gevolgen"))
-    lines.append("")
-    lines.append("## 3.3 Remove cause")
-    lines.append(val("oorzaak_wegnemen"))
-    lines.append("")
-    lines.append("## 3.4 Could the deviation have occurred elsewhere")
-    lines.append(val("elders_voorgedaan"))
-    lines.append("")
-    lines.append("## 3.5 Actions on deviation that occurred elsewhere")
-    lines.append(val("acties_elders"))
-    lines.append("")
-    lines.append(
-        "# 4. Assessment of measures taken This chapter will be filled once the JIRA actions are completed."
-    )
-    lines.append("")
-    lines.append("## 4.1 Effectiveness of the measures taken")
-    lines.append(val("doeltreffendheid"))
-    lines.append("")
-    lines.append("## 4.2 Update of risk inventory based on deviation (if applicable)")
-    lines.append(val("actualisatie_risico"))
-    lines.append("")
-    lines.append("## 4.3 Adjustment to quality system (if applicable)")
-    lines.append(val("aanpassing_kwaliteitssysteem"))
-    lines.append("")
-    lines.append("# 5. Lessons learned")
-    lines.append(val("leerpunten"))
-    lines.append("")
-    lines.append("# 6. Relation to ISO 27001 Annex A controls")
-    lines.append(val("relatie_iso27001_annex_a"))
+def render_markdown(template: IncidentTemplate) -> str:
+    """
+    Render a human-readable markdown document from the incident template fields.
 
-    return "\n".join(lines)
+    @param template: Pydantic model with incident fields (may contain empty strings/None).
+    @return str: Markdown string with numbered headings and filled sections.
+    """
+    return render_markdown_from_dict(template.model_dump())
@@ -0,0 +1,197 @@
+from __future__ import annotations
+
+import logging
+import threading
+import time
+from typing import Any, Dict, Optional
+
+log = logging.getLogger(__name__)
+
+# Conversations are keyed by channel, then thread_ts; sessions by Slack user id
+UserId = str
+
+# Defaults for eviction: abandoned conversations and sessions age out
+CONV_TTL_SECONDS: float = 7 * 24 * 60 * 60
+SESSION_TTL_SECONDS: float = 2 * 24 * 60 * 60
+MAX_CONVERSATIONS: int = 10_000
+SWEEP_INTERVAL_SECONDS: float = 10 * 60
+
+
+class SessionStore:
+    """Store for per-user DM sessions and per-thread conversation state.
+
+    In-process only: values are returned by reference and the Slack handlers
+    mutate them in place. Conversations also hold unserialisable state (an
+    RLock, a deque, a set), so they cannot live in an external store as is.
+
+    Memory is bounded by sweep(): conversations not read or written for
+    conv_ttl_seconds and sessions older than session_ttl_seconds (by
+    "created_at") are dropped, and beyond max_conversations the least recently
+    used conversations go first. start_sweeper() runs it periodically.
+    """
+
+    def __init__(
+        self,
+        conv_ttl_seconds: float = CONV_TTL_SECONDS,
+        session_ttl_seconds: float = SESSION_TTL_SECONDS,
+        max_conversations: int = MAX_CONVERSATIONS,
+    ) -> None:
+        self.conv_ttl_seconds = conv_ttl_seconds
+        self.session_ttl_seconds = session_ttl_seconds
+        self.max_conversations = max_conversations
+        self._sessions: Dict[UserId, Dict[str, Any]] = {}
+        # channel → thread_ts → conversation; avoids building a key tuple per lookup
+        self._convs: Dict[str, Dict[str, Dict[str, Any]]] = {}
+        # Bolt dispatches events on multiple threads; guard structural changes
+        self._lock = threading.Lock()
+
+    # ===== Sessions =====
+    def get(self, user_id: UserId) -> Optional[Dict[str, Any]]:
+        """
+        Return the session for a user, if any.
+
+        @param user_id: Slack user id
+        @return Optional[Dict[str, Any]]: Session dict or None
+        """
+        return self._sessions.get(user_id)
+
+    def put(self, user_id: UserId, sess: Dict[str, Any]) -> None:
+        """
+        Store (or replace) the session for a user.
+
+        @param user_id: Slack user id
+        @param sess: Session dict
+        @return None
+        """
+        with self._lock:
+            self._sessions[user_id] = sess
+
+    def pop(self, user_id: UserId) -> Optional[Dict[str, Any]]:
+        """
+        Remove and return the session for a user, if any.
+
+        @param user_id: Slack user id
+        @return Optional[Dict[str, Any]]: Removed session dict or None
+        """
+        with self._lock:
+            return self._sessions.pop(user_id, None)
+
+    def sessions(self) -> list[Dict[str, Any]]:
+        """
+        Return a snapshot of all sessions.
+
+        @return list[Dict[str, Any]]: Session dicts
+        """
+        with self._lock:
+            return list(self._sessions.values())
+
+    # ===== Conversations =====
+    def get_conv(self, channel: str, thread_ts: str) -> Optional[Dict[str, Any]]:
+        """
+        Return the conversation state for a thread, if any.
+
+        @param channel: Channel id
+        @param thread_ts: Thread root timestamp
+        @return Optional[Dict[str, Any]]: Conversation dict or None
+        """
+        threads = self._convs.get(channel)
+        conv = threads.get(thread_ts) if threads else None
+        if conv is not None:
+            conv["_touched"] = time.time()
+        return conv
+
+    def put_conv(self, channel: str, thread_ts: str, conv: Dict[str, Any]) -> None:
+        """
+        Store (or replace) the conversation state for a thread.
+
+        @param channel: Channel id
+        @param thread_ts: Thread root timestamp
+        @param conv: Conversation dict
+        @return None
+        """
+        conv["_touched"] = time.time()
+        with self._lock:
+            self._convs.setdefault(channel, {})[thread_ts] = conv
+
+    def pop_conv(self, channel: str, thread_ts: str) -> Optional[Dict[str, Any]]:
+        """
+        Remove and return the conversation state for a thread, if any.
+
+        @param channel: Channel id
+        @param thread_ts: Thread root timestamp
+        @return Optional[Dict[str, Any]]: Removed conversation dict or None
+        """
+        with self._lock:
+            threads = self._convs.get(channel)
+            if not threads:
+                return None
+            conv = threads.pop(thread_ts, None)
+            if not threads:
+                # Drop empty channel buckets
+                del self._convs[channel]
+            return conv
+
+    # ===== Eviction =====
+    def sweep(self, now: Optional[float] = None) -> int:
+        """
+        Drop expired sessions and conversations, then enforce max_conversations.
+
+        @param now: Current time (defaults to time.time())
+        @return int: Number of entries removed
+        """
+        now = time.time() if now is None else now
+        removed = 0
+        with self._lock:
+            for user_id, sess in list(self._sessions.items()):
+                created_at = sess.get("created_at")
+                if created_at is None:
+                    continue
+                if now - float(created_at) > self.session_ttl_seconds:
+                    del self._sessions[user_id]
+                    removed += 1
+            live: list[tuple[float, str, str]] = []
+            for channel, threads in list(self._convs.items()):
+                for thread_ts, conv in list(threads.items()):
+                    touched = float(conv.get("_touched", now))
+                    if now - touched > self.conv_ttl_seconds:
+                        del threads[thread_ts]
+                        removed += 1
+                    else:
+                        live.append((touched, channel, thread_ts))
+                if not threads:
+                    del self._convs[channel]
+            overflow = len(live) - self.max_conversations
+            if overflow > 0:
+                # Least recently used first
+                live.sort()
+                for _, channel, thread_ts in live[:overflow]:
+                    threads = self._convs[channel]
+                    del threads[thread_ts]
+                    if not threads:
+                        del self._convs[channel]
+                removed += overflow
+        return removed
+
+    def start_sweeper(self, interval_seconds: float = SWEEP_INTERVAL_SECONDS) -> None:
+        """
+        Run sweep() every interval_seconds on a daemon timer thread.
+
+        @param interval_seconds: Time between sweeps
+        @return None
+        """
+
+        def _run() -> None:
+            try:
+                removed = self.sweep()
+                if removed:
+                    log.info("SessionStore sweep removed %d entries", removed)
+            except Exception as e:
+                log.error("SessionStore sweep failed: %s", e)
+            self.start_sweeper(interval_seconds)
+
+        timer = threading.Timer(interval_seconds, _run)
+        timer.daemon = True
+        timer.start()
+
+    def __repr__(self) -> str:
+        return f"SessionStore(sessions={self._sessions!r}, conversations={sum(map(len, self._convs.values()))})"
@@ -1,10 +1,19 @@
 from __future__ import annotations
 
 import os
+import re
+import hashlib
+import json
 import logging
-from typing import Any, Dict, Optional, TYPE_CHECKING
+import threading
+from bisect import bisect_left
+from collections import deque
+from functools import lru_cache
+from types import MappingProxyType
+from typing import Any, Dict, Mapping, Optional, TYPE_CHECKING
 
 from incident_agent.schema import DUTCH_FIELD_LABELS
+from incident_agent.render import render_markdown_from_dict
 from incident_agent import messages as MSG
 
 if TYPE_CHECKING:  # Avoid runtime import to prevent circular dependency
@@ -16,29 +25,37 @@ if TYPE_CHECKING:  # Avoid runtime import to prevent circular dependency
 # =========================
 
 
-def q_text(q: Any) -> str:
-    if isinstance(q, dict):
-        return str(q.get("question_text", ""))
-    return str(getattr(q, "question_text", ""))
+# Questions are stored in conversation state as dumped dicts (see
+# IncidentExtractor.initial_state), so the getters only handle that shape.
+# q_number/q_display stamp their result on the question ("_num"/"_display")
+# the first time, as a question's field and text do not change.
 
 
-def q_field(q: Any) -> str:
-    if isinstance(q, dict):
-        return str(q.get("field_key", ""))
-    return str(getattr(q, "field_key", ""))
+def q_text(q: Dict[str, Any]) -> str:
+    return str(q.get("question_text", ""))
 
 
-def q_number(q: Any) -> str:
-    field_key = q_field(q)
-    label = DUTCH_FIELD_LABELS.get(field_key, field_key)
-    num = label.split(" ")[0].strip()
-    return num if num.replace(".", "").isdigit() else ""
+def q_field(q: Dict[str, Any]) -> str:
+    return str(q.get("field_key", ""))
+
+
+def q_number(q: Dict[str, Any]) -> str:
+    num = q.get("_num")
+    if num is None:
+        field_key = q_field(q)
+        label = DUTCH_FIELD_LABELS.get(field_key, field_key)
+        num = label.split(" ")[0].strip()
+        num = q["_num"] = num if num.replace(".", "").isdigit() else ""
+    return num
 
 
-def q_display(q: Any) -> str:
-    num = q_number(q)
-    text = q_text(q)
-    return f"{num}: {text}" if num else text
+def q_display(q: Dict[str, Any]) -> str:
+    display = q.get("_display")
+    if display is None:
+        num = q_number(q)
+        text = q_text(q)
+        display = q["_display"] = f"{num}: {text}" if num else text
+    return display
 
 
 # =========================
@@ -46,19 +63,41 @@ def q_display(q: Any) -> str:
 # =========================
 
 
-def is_accept(text: str) -> bool:
-    t = text.strip().lower()
-    return t in {"ja", "ok", "okay", "akkoord", "yes", "y", "accept"}
+ACCEPT_WORDS = frozenset({"ja", "ok", "okay", "akkoord", "yes", "y", "accept"})
+YES_WORDS = frozenset({"ja", "yes", "y"})
+NO_WORDS = frozenset({"nee", "no", "n"})
+# classify() kinds that count as accepting a proposal or confirmation
+ACCEPT_KINDS = frozenset({"yes", "accept"})
+# Input modes accepted by `mode <story|literal>`
+MODE_WORDS = ("story", "literal")
 
 
-def is_yes(text: str) -> bool:
-    t = text.strip().lower()
-    return t in {"ja", "yes", "y"}
+def norm(text: str) -> str:
+    return text.strip().lower()
 
 
-def is_no(text: str) -> bool:
-    t = text.strip().lower()
-    return t in {"nee", "no", "n"}
+def classify(text: str) -> tuple[str, str]:
+    """
+    Classify a reply once so the confirmation branches can share the result.
+
+    @param text: Raw user text
+    @return tuple[str, str]: (kind, rest) where kind is one of "yes", "accept"
+        (an accept word other than a plain yes), "no", "new" or "other"; rest is
+        the text after `new` for "new" and the stripped text otherwise.
+    """
+    t = text.strip()
+    tl = t.lower()
+    if tl in YES_WORDS:
+        return ("yes", "")
+    if tl in ACCEPT_WORDS:
+        return ("accept", "")
+    if tl in NO_WORDS:
+        return ("no", "")
+    if tl == "new":
+        return ("new", "")
+    if tl.startswith("new "):
+        return ("new", t.split(" ", 1)[1])
+    return ("other", t)
 
 
 def parse_mode_prefix(text: str) -> tuple[Optional[str], str]:
@@ -78,18 +117,130 @@ def parse_mode_prefix(text: str) -> tuple[Optional[str], str]:
 # =========================
 
 
+def is_filled(value: Any) -> bool:
+    return isinstance(value, str) and bool(value.strip())
+
+
+def filled_fields(data: Dict[str, Any]) -> set[str]:
+    return {k for k, v in data.items() if is_filled(v)}
+
+
+def get_filled(conv: Dict[str, Any]) -> set[str]:
+    """
+    Return the set of filled field keys for a conversation, building it on first use.
+
+    @param conv: Conversation state dict
+    @return set[str]: Field keys whose value is non-empty
+    """
+    filled = conv.get("filled")
+    if filled is None:
+        filled = conv["filled"] = filled_fields(conv.get("data", {}) or {})
+    return filled
+
+
+def set_field(conv: Dict[str, Any], field: str, value: str) -> None:
+    """
+    Write a field value, keeping the filled-field set and data version in step.
+
+    @param conv: Conversation state dict
+    @param field: Template field key
+    @param value: New value for the field
+    @return None
+    """
+    filled_set = get_filled(conv)
+    conv.setdefault("data", {})[field] = value
+    conv["data_version"] = conv.get("data_version", 0) + 1
+    filled = is_filled(value)
+    if filled:
+        filled_set.add(field)
+    else:
+        filled_set.discard(field)
+    unanswered = conv.get("unanswered")
+    if unanswered is not None:
+        for i in conv["field_to_index"].get(field, ()):
+            pos = bisect_left(unanswered, i)
+            present = pos < len(unanswered) and unanswered[pos] == i
+            if filled and present:
+                del unanswered[pos]
+            elif not filled and not present:
+                unanswered.insert(pos, i)
+
+
+def rendered(conv: Dict[str, Any]) -> str:
+    """
+    Return the rendered markdown document for a conversation.
+
+    The result is cached on the conversation and reused until set_field bumps
+    conv["data_version"].
+
+    @param conv: Conversation state dict
+    @return str: Markdown document
+    """
+    version = conv.get("data_version", 0)
+    cache = conv.get("_render_cache")
+    if cache and cache["ver"] == version:
+        return cache["md"]
+    md = render_markdown_from_dict(conv.get("data", {}))
+    conv["_render_cache"] = {"ver": version, "md": md}
+    return md
+
+
+def data_digest(conv: Dict[str, Any]) -> str:
+    """
+    Return a digest of the conversation's field data.
+
+    Like rendered(), the result is cached until set_field bumps conv["data_version"].
+
+    @param conv: Conversation state dict
+    @return str: Hex digest identifying the current field values
+    """
+    version = conv.get("data_version", 0)
+    cache = conv.get("_digest_cache")
+    if cache and cache["ver"] == version:
+        return cache["digest"]
+    payload = json.dumps(conv.get("data", {}), sort_keys=True, default=str)
+    digest = hashlib.blake2b(payload.encode("utf-8"), digest_size=16).hexdigest()
+    conv["_digest_cache"] = {"ver": version, "digest": digest}
+    return digest
+
+
+def advance_autofill_queue(conv: Dict[str, Any], field: str) -> Optional[str]:
+    """
+    Remove a just-confirmed field from the autofill queue.
+
+    The queue is a deque whose head is normally the confirmed field, so this is
+    an O(1) popleft in the common case.
+
+    @param conv: Conversation state dict
+    @param field: Field that was just confirmed
+    @return Optional[str]: Next queued field to propose, if any
+    """
+    queue = conv.get("autofill_queue")
+    if not queue:
+        return None
+    if not isinstance(queue, deque):
+        queue = conv["autofill_queue"] = deque(queue)
+    if queue[0] == field:
+        queue.popleft()
+    else:
+        try:
+            queue.remove(field)
+        except ValueError:
+            pass
+    return queue[0] if queue else None
+
+
 def format_status(conv: Dict[str, Any]) -> str:
-    data = conv.get("data", {})
     questions = conv.get("questions", [])
     idx = conv.get("index", 0)
-    filled = [k for k, v in data.items() if isinstance(v, str) and v.strip()]
+    filled_count = len(get_filled(conv))
     remaining = max(len(questions) - idx, 0)
     mode = conv.get("mode", "story")
     pending = conv.get("pending") or {}
     pending_field = pending.get("field")
     lines = [
         "Status:",
-        f"- Filled fields: {len(filled)}",
+        f"- Filled fields: {filled_count}",
         f"- Open questions: {remaining}",
         f"- Input mode: {mode}",
     ]
@@ -119,18 +270,40 @@ def next_step_text(conv: Dict[str, Any]) -> str:
     return MSG.no_open_questions_short()
 
 
-def compute_next_index(conv: Dict[str, Any], start_index: int) -> int:
+def _index_questions(conv: Dict[str, Any]) -> list[int]:
+    """
+    Build the question indexes used by compute_next_index.
+
+    Stores conv["field_to_index"] (field key → question indices) and
+    conv["unanswered"] (sorted indices of questions whose field is still empty);
+    set_field keeps both in step afterwards.
+
+    @param conv: Conversation state dict
+    @return list[int]: The unanswered index list
+    """
     questions = conv.get("questions", []) or []
-    data = conv.get("data", {}) or {}
+    filled = get_filled(conv)
+    field_to_index: Dict[str, list[int]] = {}
+    unanswered: list[int] = []
+    for i, q in enumerate(questions):
+        field = q.get("field_key")
+        field_to_index.setdefault(field, []).append(i)
+        if field not in filled:
+            unanswered.append(i)
+    conv["field_to_index"] = field_to_index
+    conv["unanswered"] = unanswered
+    return unanswered
+
+
+def compute_next_index(conv: Dict[str, Any], start_index: int) -> int:
+    unanswered = conv.get("unanswered")
+    if unanswered is None:
+        unanswered = _index_questions(conv)
     i = max(int(start_index or 0), 0)
-    while i < len(questions):
-        fq = questions[i].get("field_key") if isinstance(questions[i], dict) else None
-        val = data.get(fq)
-        if isinstance(val, str) and val.strip():
-            i += 1
-            continue
-        break
-    return i
+    pos = bisect_left(unanswered, i)
+    if pos < len(unanswered):
+        return unanswered[pos]
+    return max(i, len(conv.get("questions", []) or []))
 
 
 # =========================
@@ -147,39 +320,98 @@ def _build_number_index() -> Dict[str, str]:
     return index
 
 
-_NUMBER_INDEX = _build_number_index()
+# Read-only after import; shared by every thread
+_NUMBER_INDEX: Mapping[str, str] = MappingProxyType(_build_number_index())
+
+# (field key, lowercased label/key) pairs in template order, for substring scans
+_LABELS_LOWER: tuple[tuple[str, str], ...] = tuple(
+    (key, label.lower()) for key, label in DUTCH_FIELD_LABELS.items()
+)
+_KEYS_LOWER: tuple[tuple[str, str], ...] = tuple(
+    (key, key.lower()) for key in DUTCH_FIELD_LABELS
+)
+
+
+def _scan_field_key(t: str) -> Optional[str]:
+    # Partial tokens: first label containing it, then first key containing it
+    for key, label in _LABELS_LOWER:
+        if t in label:
+            return key
+    for key, key_lower in _KEYS_LOWER:
+        if t in key_lower:
+            return key
+    return None
+
+
+def _build_alias_index() -> Dict[str, str]:
+    """
+    Map every lowercased token resolve_field_key can receive to its field key.
+
+    Tokens never contain spaces, so besides field keys and section numbers every
+    substring of a label word or key is precomputed with the same precedence as
+    the scan: exact key, then number, then first label, then first key.
+
+    @return Dict[str, str]: token → field key
+    """
+    index: Dict[str, str] = {
+        **_NUMBER_INDEX,
+        **{key.lower(): key for key in DUTCH_FIELD_LABELS},
+    }
+    words = {
+        word
+        for text in (*DUTCH_FIELD_LABELS.values(), *DUTCH_FIELD_LABELS.keys())
+        for word in text.lower().split()
+    }
+    for word in words:
+        for i in range(len(word)):
+            for j in range(i + 1, len(word) + 1):
+                fragment = word[i:j]
+                if fragment not in index:
+                    key = _scan_field_key(fragment)
+                    if key:
+                        index[fragment] = key
+    return index
+
+
+ALIAS_TO_KEY: Mapping[str, str] = MappingProxyType(_build_alias_index())
 
 
 def resolve_field_key(user_token: str) -> Optional[str]:
     t = user_token.strip().lower()
     if not t:
         return None
-    if t in DUTCH_FIELD_LABELS:
-        return t
-    if t in _NUMBER_INDEX:
-        return _NUMBER_INDEX[t]
-    for key, label in DUTCH_FIELD_LABELS.items():
-        lbl = label.lower()
-        if lbl.startswith(t) or t in lbl:
-            return key
-    for key in DUTCH_FIELD_LABELS.keys():
-        if t in key.lower():
-            return key
-    return None
+    key = ALIAS_TO_KEY.get(t)
+    if key:
+        return key
+    # Only tokens with unusual whitespace or no match at all reach the scan
+    return _scan_field_key(t)
+
+
+FIELDS_LIST_HEADER = "Fields (use with `edit <field> <value>`):"
+FIELD_PREVIEW_LEN = 80
+
+# (field key, row prefix) per template field, built once
+_FIELD_ROW_TEMPLATE: tuple[tuple[str, str], ...] = tuple(
+    (key, f"- {label.split(' ')[0]} | {key}: ")
+    for key, label in DUTCH_FIELD_LABELS.items()
+)
+
+
+def _preview(value: Any) -> str:
+    if not isinstance(value, str):
+        return ""
+    value = value.strip()
+    if len(value) > FIELD_PREVIEW_LEN:
+        return value[:FIELD_PREVIEW_LEN] + "…"
+    return value
 
 
 def format_fields_list(conv: Dict[str, Any]) -> str:
     data = conv.get("data", {})
-    lines = ["Fields (use with `edit <field> <value>`):"]
-    for key, label in DUTCH_FIELD_LABELS.items():
-        value = data.get(key)
-        preview = (
-            ""
-            if not isinstance(value, str)
-            else (value.strip()[:80] + ("…" if len(value.strip()) > 80 else ""))
-        )
-        num = label.split(" ")[0]
-        lines.append(f"- {num} | {key}: {preview}")
+    lines = [FIELDS_LIST_HEADER]
+    lines.extend(
+        prefix + _preview(data.get(key)) for key, prefix in _FIELD_ROW_TEMPLATE
+    )
     return "\n".join(lines)
 
 
@@ -188,44 +420,85 @@ def format_fields_list(conv: Dict[str, Any]) -> str:
 # =========================
 
 
-def to_adf(md_text: str) -> Dict[str, Any]:
-    lines = (md_text or "").splitlines()
-    content: list[Dict[str, Any]] = []
-    for line in lines:
-        s = line.rstrip("\n")
-        if s.strip() == "":
-            content.append({"type": "paragraph", "content": []})
+# ADF node type names shared by the node builders below
+ADF_DOC = "doc"
+ADF_HEADING = "heading"
+ADF_PARAGRAPH = "paragraph"
+ADF_TEXT = "text"
+
+
+def adf_heading(level: int, text: str) -> Dict[str, Any]:
+    return {
+        "type": ADF_HEADING,
+        "attrs": {"level": level},
+        "content": [{"type": ADF_TEXT, "text": text}],
+    }
+
+
+def adf_paragraph(text: str = "") -> Dict[str, Any]:
+    # A fresh dict every time: callers may extend the content list
+    if not text:
+        return {"type": ADF_PARAGRAPH, "content": []}
+    return {"type": ADF_PARAGRAPH, "content": [{"type": ADF_TEXT, "text": text}]}
+
+
+def adf_doc(content: list[Dict[str, Any]]) -> Dict[str, Any]:
+    return {"type": ADF_DOC, "version": 1, "content": content or [adf_paragraph()]}
+
+
+# `#`..`######` followed by a space; anything else is a paragraph
+ADF_HEADING_RE = re.compile(r"(#{1,6}) (.*)", re.DOTALL)
+
+
+def append_adf_lines(content: list[Dict[str, Any]], md_text: str) -> None:
+    """
+    Append one ADF node per markdown line: headings for `#`..`######` lines,
+    empty paragraphs for blank lines and text paragraphs otherwise.
+
+    @param content: ADF content list to extend in place
+    @param md_text: Markdown text
+    @return None
+    """
+    n = len(md_text)
+    pos = 0
+    nl = -1
+    # Single pass over the text: locate each line end with str.find instead of
+    # materialising a list of lines, and classify the line from its first chars.
+    # Like str.splitlines(), "\n", "\r\n" and a lone "\r" all end a line.
+    while pos < n:
+        if nl < pos:
+            nl = md_text.find("\n", pos)
+            if nl < 0:
+                nl = n
+        cr = md_text.find("\r", pos, nl)
+        if cr < 0:
+            s = md_text[pos:nl]
+            pos = nl + 1
+        else:
+            s = md_text[pos:cr]
+            pos = cr + 2 if cr + 1 == nl else cr + 1
+        if not s.strip():
+            content.append(adf_paragraph())
             continue
-        i = 0
-        while i < len(s) and s[i] == "#":
-            i += 1
-        if i > 0 and i <= 6 and i < len(s) and s[i] == " ":
-            heading_text = s[i + 1 :].lstrip()
-            content.append(
-                {
-                    "type": "heading",
-                    "attrs": {"level": i},
-                    "content": [{"type": "text", "text": heading_text}],
-                }
-            )
+        m = ADF_HEADING_RE.match(s)
+        if m:
+            content.append(adf_heading(len(m.group(1)), m.group(2).lstrip()))
         else:
-            content.append(
-                {"type": "paragraph", "content": [{"type": "text", "text": s}]}
-            )
-    if not content:
-        content = [{"type": "paragraph", "content": []}]
-    return {"type": "doc", "version": 1, "content": content}
+            content.append(adf_paragraph(s))
+
+
+def to_adf(md_text: str) -> Dict[str, Any]:
+    content: list[Dict[str, Any]] = []
+    append_adf_lines(content, md_text or "")
+    return adf_doc(content)
 
 
 def to_adf_desc(md_text: str) -> Dict[str, Any]:
     return to_adf(md_text)
 
 
-def _load_usage_text() -> str:
-    """Load USAGE.md from well-known locations.
-
-    Prefer a project-root `USAGE.md`. Allow override via USAGE_MD_PATH.
-    """
+def _usage_candidates() -> list[str]:
+    """List the locations USAGE.md is looked up in, most specific first."""
     module_dir = os.path.abspath(os.path.dirname(__file__))
     candidates: list[str] = []
     # Explicit override via env
@@ -240,66 +513,131 @@ def _load_usage_text() -> str:
     candidates.append(os.path.abspath(os.path.join(os.getcwd(), "USAGE.md")))
     # Common container root path
     candidates.append("/app/USAGE.md")
+    return candidates
+
 
+def _find_usage_file() -> Optional[tuple[str, float]]:
+    """
+    Return the path and modification time of the first existing USAGE.md.
+
+    @return Optional[tuple[str, float]]: (path, mtime), or None if none exists
+    """
+    candidates = _usage_candidates()
     for path in candidates:
         try:
             if path and os.path.isfile(path):
-                with open(path, "r", encoding="utf-8") as f:
-                    return f.read()
+                return (path, os.stat(path).st_mtime)
         except Exception as e:
             logging.warning(f"Error reading USAGE.md candidate {path}: {e}")
-
     logging.error(
         "Failed to load USAGE.md for App Home: none of the candidate paths exist: %s",
         candidates,
     )
+    return None
+
+
+def _load_usage_text(path: Optional[str] = None) -> str:
+    """Load USAGE.md from well-known locations.
+
+    Prefer a project-root `USAGE.md`. Allow override via USAGE_MD_PATH.
+    """
+    if path is None:
+        found = _find_usage_file()
+        path = found[0] if found else None
+    if path:
+        try:
+            with open(path, "r", encoding="utf-8") as f:
+                return f.read()
+        except Exception as e:
+            logging.warning(f"Error reading USAGE.md candidate {path}: {e}")
     return "Usage guide unavailable. Make sure USAGE.md exists at the project root."
 
 
+# Slack caps section text at 3000 characters; keep a margin
+SECTION_TEXT_MAX_LEN = 2900
+
+
+def _split_long_line(line: str, max_len: int = SECTION_TEXT_MAX_LEN) -> list[str]:
+    """
+    Split a line longer than max_len, preferring the last space before each cut.
+
+    @param line: Line of text
+    @param max_len: Maximum piece length
+    @return list[str]: Pieces of at most max_len characters
+    """
+    pieces: list[str] = []
+    start = 0
+    while len(line) - start > max_len:
+        cut = line.rfind(" ", start + 1, start + max_len + 1)
+        if cut <= start:
+            cut = start + max_len
+        pieces.append(line[start:cut])
+        start = cut + 1 if line[cut : cut + 1] == " " else cut
+    pieces.append(line[start:])
+    return pieces
+
+
+# Any run of leading `#` marks an App Home heading
+HOME_HEADING_RE = re.compile(r"#+(.*)", re.DOTALL)
+
+
 def _markdown_to_blocks(md: str) -> list[Dict[str, Any]]:
     blocks: list[Dict[str, Any]] = []
     lines = (md or "").splitlines()
     in_code = False
     paragraph_parts: list[str] = []
+    # Length of "\n".join(paragraph_parts), tracked as lines are added
+    paragraph_len = -1
+
+    def add_section(text: str) -> None:
+        if text:
+            blocks.append({"type": "section", "text": {"type": "mrkdwn", "text": text}})
+
+    def add_line(line: str) -> None:
+        nonlocal paragraph_len
+        paragraph_parts.append(line)
+        paragraph_len += len(line) + 1
 
     def flush_paragraph() -> None:
+        nonlocal paragraph_len
         if not paragraph_parts:
             return
-        text = "\n".join(paragraph_parts).strip()
-        if not text:
-            paragraph_parts.clear()
-            return
-        max_len = 2900
-        start = 0
-        while start < len(text):
-            chunk = text[start : start + max_len]
-            blocks.append(
-                {"type": "section", "text": {"type": "mrkdwn", "text": chunk}}
-            )
-            start += max_len
+        if paragraph_len <= SECTION_TEXT_MAX_LEN:
+            add_section("\n".join(paragraph_parts).strip())
+        else:
+            # Pack whole lines into sections; only over-long lines are split
+            buf: list[str] = []
+            buf_len = -1
+            for part in paragraph_parts:
+                for piece in _split_long_line(part):
+                    if buf and buf_len + len(piece) + 1 > SECTION_TEXT_MAX_LEN:
+                        add_section("\n".join(buf).strip())
+                        buf, buf_len = [], -1
+                    buf.append(piece)
+                    buf_len += len(piece) + 1
+            add_section("\n".join(buf).strip())
         paragraph_parts.clear()
+        paragraph_len = -1
 
     for raw in lines:
         s = raw.rstrip("\n")
         if s.strip().startswith("```"):
             if in_code:
-                paragraph_parts.append("```")
+                add_line("```")
                 in_code = False
                 flush_paragraph()
             else:
                 flush_paragraph()
                 in_code = True
-                paragraph_parts.append("```")
+                add_line("```")
             continue
         if in_code:
-            paragraph_parts.append(s)
+            add_line(s)
             continue
-        if s.startswith("#"):
+        m = HOME_HEADING_RE.match(s)
+        if m:
             flush_paragraph()
-            i = 0
-            while i < len(s) and s[i] == "#":
-                i += 1
-            heading_text = s[i:].strip()
+            heading_text = m.group(1).strip()
             formatted = f"*{heading_text}*" if heading_text else ""
             if formatted:
                 blocks.append(
@@ -309,14 +647,31 @@ def _markdown_to_blocks(md: str) -> list[Dict[str, Any]]:
         if s.strip() == "":
             flush_paragraph()
             continue
-        paragraph_parts.append(s)
+        add_line(s)
 
     flush_paragraph()
     return blocks[:100]
 
 
+# App Home blocks for the last USAGE.md seen, as ((path, mtime), blocks); replaced
+# in one assignment so concurrent readers never pair a key with other blocks
+_HOME_BLOCKS_CACHE: Dict[str, Any] = {"entry": None}
+
+
 def build_home_view() -> Dict[str, Any]:
-    md = _load_usage_text()
+    """
+    Build the App Home view from USAGE.md.
+
+    The parsed blocks are reused until the file's path or modification time
+    changes, so repeated app_home_opened events only stat the file.
+
+    @return Dict[str, Any]: Slack home view payload
+    """
+    found = _find_usage_file()
+    entry = _HOME_BLOCKS_CACHE["entry"]
+    if found is not None and entry is not None and entry[0] == found:
+        return {"type": "home", "blocks": list(entry[1])}
+    md = _load_usage_text(found[0] if found else "")
     blocks: list[Dict[str, Any]] = []
     blocks.append(
         {
@@ -330,7 +685,9 @@ def build_home_view() -> Dict[str, Any]:
     )
     blocks.append({"type": "divider"})
     blocks.extend(_markdown_to_blocks(md))
-    return {"type": "home", "blocks": blocks}
+    if found is not None:
+        _HOME_BLOCKS_CACHE["entry"] = (found, tuple(blocks))
+    return {"type": "home", "blocks": list(blocks)}
 
 
 # =========================
@@ -338,32 +695,60 @@ def build_home_view() -> Dict[str, Any]:
 # =========================
 
 
+def _rewrite(extractor: IncidentExtractor, field_key: str, raw_text: str) -> str:
+    label = DUTCH_FIELD_LABELS.get(field_key, field_key)
+    messages = [
+        {"role": "system", "content": MSG.rewriter_system_prompt()},
+        {"role": "user", "content": MSG.rewriter_user_prompt(label, raw_text)},
+    ]
+    completion = extractor.client.chat.completions.create(
+        model=extractor.model,
+        messages=messages,
+    )
+    content = completion.choices[0].message.content or ""
+    return content.strip()
+
+
+# Set by _rewrite_cached on the calling thread when the cache had no entry
+_REWRITE_STATE = threading.local()
+
+
+@lru_cache(maxsize=1024)
+def _rewrite_cached(extractor: IncidentExtractor, field_key: str, raw_text: str) -> str:
+    # The prompt only depends on the field label and the user's text, so identical
+    # submissions (e.g. a retyped answer) reuse the earlier completion. Errors
+    # propagate and are therefore never cached.
+    _REWRITE_STATE.missed = True
+    return _rewrite(extractor, field_key, raw_text)
+
+
 def rewrite_with_model(
     extractor: IncidentExtractor,
     raw_text: str,
     field_key: str,
     current_data: Dict[str, Any],
+    cache: bool = True,
 ) -> str:
     """
     Rewrite user input into a concise sentence using the model.
 
-    Returns empty string on blank input; returns original on error.
+    Returns empty string on blank input; returns original on error. With
+    cache=False the model is always called and the result is not memoised.
     """
+    if not isinstance(raw_text, str) or not raw_text.strip():
+        return ""
     try:
-        label = DUTCH_FIELD_LABELS.get(field_key, field_key)
-        sys = MSG.rewriter_system_prompt()
-        if not isinstance(raw_text, str) or not raw_text.strip():
-            return ""
-        messages = [
-            {"role": "system", "content": sys},
-            {"role": "user", "content": MSG.rewriter_user_prompt(label, raw_text)},
-        ]
-        completion = extractor.client.chat.completions.create(
-            model=extractor.model,
-            messages=messages,
+        if not cache:
+            logging.debug("rewrite cache bypassed for %s", field_key)
+            return _rewrite(extractor, field_key, raw_text)
+        _REWRITE_STATE.missed = False
+        value = _rewrite_cached(extractor, field_key, raw_text)
+        logging.debug(
+            "rewrite cache %s for %s",
+            "miss" if _REWRITE_STATE.missed else "hit",
+            field_key,
         )
-        content = completion.choices[0].message.content or ""
-        return content.strip()
+        return value
     except Exception as e:
         logging.error(f"Error rewriting with model: {e}")
         return raw_text
@@ -402,6 +787,24 @@ def revise_with_history(
         return instructions
 
 
+# Refinement turns kept per pending field; the first user/assistant pair is
+# always kept so the original input stays the revision source
+MAX_PENDING_HISTORY = 16
+
+
+def trim_history(history: list[dict], limit: int = MAX_PENDING_HISTORY) -> list[dict]:
+    """
+    Bound a pending field's history to the first pair plus the latest turns.
+
+    @param history: Per-field history messages (oldest first)
+    @param limit: Maximum number of messages to keep
+    @return list[dict]: History of at most limit messages
+    """
+    if len(history) <= limit:
+        return history
+    return history[:2] + history[len(history) - (limit - 2) :]
+
+
 def set_pending_with_history(
     conv: Dict[str, Any], field: str, user_text: str, draft_value: str
 ) -> None:
@@ -413,30 +816,3 @@ def set_pending_with_history(
         {"role": "assistant", "content": draft_value or ""},
     ]
     conv["pending"] = {"field": field, "candidate": draft_value, "history": history}
-
-
-def propose_confirmation_for_field(
-    extractor: IncidentExtractor,
-    conv: Dict[str, Any],
-    field: str,
-    thread_ts: str,
-    say,
-) -> None:  # type: ignore
-    """
-    Propose a reformulated value for a field and request user confirmation.
-    """
-    current_value = conv.get("data", {}).get(field, "")
-    mode_to_use = conv.get("mode", "story")
-    value = (
-        rewrite_with_model(extractor, str(current_value), field, conv.get("data", {}))
-        if isinstance(current_value, str)
-        and current_value.strip()
-        and mode_to_use == "story"
-        else str(current_value)
-    )
-    set_pending_with_history(conv, field, str(current_value), value)
-    label = DUTCH_FIELD_LABELS.get(field, field)
-    say(
-        text=MSG.proposal(label, value),
-        thread_ts=thread_ts,
-    )